@@ -7,76 +7,111 @@ Streamlit Wi-Fi Scanner + Safe DoS Simulation (Demo)
 """
 
 import streamlit as st
-import time
 import json
-import random
-from datetime import datetime
+import os
+import tempfile
+from datetime import datetime, timedelta
 import pandas as pd
-
-# Try to import pywifi; if not available or fails, we'll use a mock scan
-try:
-    import pywifi
-    from pywifi import const
-    PYWIFI_AVAILABLE = True
-except Exception:
-    PYWIFI_AVAILABLE = False
+import perf_timing
+from app_helpers import poll_every
+from perf_timing import timed
+from sim_logs import FSYNC_BATCH, FSYNC_POLICIES, LogWriter, SegmentedLog
+from sim_export import FORMATS, estimate_size, export
+from sim_archive import LogArchive, flatten_entry
+from sim_index import LogIndex
+from sim_worker import FINISHED, SimulationJob
+from sim_series import CHART_POINT_BUDGET
+from sim_sweep import (MAX_DURATION_S, MAX_INTENSITY_PPS, MAX_SWEEP_RUNS, in_bounds, parse_int_list,
+                       run_sweep, summary_frame)
+
+# pywifi is optional (wifi_scan checks the import); if missing we use a mock scan
+from wifi_scan import PYWIFI_AVAILABLE, default_backend, get_scanner, mock_scan_networks
 
 # ---- Utilities ----
 LOGFILE_NAME = "simulation_log.jsonl"  # each line is a JSON log entry
+# fsync policy of the log writer: none | batch (default) | interval
+LOG_FSYNC = os.environ.get("SIM_LOG_FSYNC", FSYNC_BATCH)
+# wall-clock speed-up per mode (0 = instant: result + log record right away)
+TIME_MODES = {"Real time (1x)": 1, "Compressed 10x": 10, "Compressed 60x": 60, "Instant": 0}
+REPLAY_CHOICES = 50  # most recent log entries offered for replay
+# time windows for the saved-log views; only segments in the window are opened
+LOG_WINDOWS = {"All": None, "Last 24 hours": 1, "Last 7 days": 7, "Last 30 days": 30}
+# export label -> (sim_export format, file suffix)
+QUERY_PAGE_SIZES = [25, 50, 100]
+# in-app downloads are built in memory; larger exports go through the sim_export.py CLI
+MAX_DOWNLOAD_MB = 50
+EXPORT_FORMATS = {
+    "NDJSON (.jsonl)": ("ndjson", FORMATS["ndjson"]),
+    "CSV (.csv)": ("csv", FORMATS["csv"]),
+    "Zip of log segments (.zip)": ("zip", FORMATS["zip"]),
+}
+
+def tick_seconds_for(mode):
+    speedup = TIME_MODES[mode]
+    return 1.0 / speedup if speedup else 0.0
+
+@st.cache_resource
+def get_segmented_log():
+    """Process-wide segmented log (active JSONL + gzip segments + manifest)."""
+    log = SegmentedLog(LOGFILE_NAME)
+    log.maybe_rotate()  # an oversized/old log from earlier versions is rolled over at once
+    return log
+
+@st.cache_resource
+def get_log_writer():
+    """Process-wide buffered writer: one thread group-commits appends from all sessions."""
+    fsync = LOG_FSYNC if LOG_FSYNC in FSYNC_POLICIES else FSYNC_BATCH
+    return LogWriter(get_segmented_log(), fsync=fsync).start()
+
+@timed("logs.append")
+def append_logs(entries):
+    """Bulk append (one batch) for sweeps; returns once the batch is written."""
+    get_log_writer().append(entries)
+
+@timed("logs.recent")
+def recent_logs(n, since=None):
+    """Newest n saved runs in the window; only the segments needed are opened."""
+    return get_segmented_log().recent(n, since=since)
+
+@st.cache_resource
+def get_log_archive():
+    """Columnar archive of closed segments + active JSONL tail."""
+    return LogArchive(get_segmented_log())
+
+@st.cache_resource
+def get_log_index():
+    """SQLite index (time/SSID/BSSID/intensity) kept current by every append to the log."""
+    return LogIndex(get_segmented_log())
+
+@timed("logs.query")
+def query_logs(page=0, page_size=50, **filters):
+    """One page of matching runs (newest first) + total count; reads only those lines."""
+    return get_log_index().query(page=page, page_size=page_size, **filters)
+
+@timed("logs.load_frame")
+def load_logs_frame():
+    """Saved Simulation Logs table built from the archive columns (fast for 100k+ runs)."""
+    return get_log_archive().frame()
+
+def export_data(fmt, ssid=None, bssid=None, since=None):
+    """Deferred download data: the export is only built when the button is clicked.
+
+    It is streamed to an anonymous temp file (deleted on close) and read back
+    once, so a download holds at most MAX_DOWNLOAD_MB in memory (checked by
+    the caller with estimate_size()).
+    """
+    log = get_segmented_log()
 
-def scan_networks_pywifi(timeout=3):
-    """Scan using pywifi. Returns list of dicts {ssid,bssid,signal,freq}"""
-    wifi = pywifi.PyWiFi()
-    ifaces = wifi.interfaces()
-    if not ifaces:
-        return []
-    iface = ifaces[0]
-    iface.scan()
-    time.sleep(timeout)
-    results = iface.scan_results()
-    networks = {}
-    for r in results:
-        key = (r.ssid, r.bssid)
-        if key not in networks or r.signal > networks[key]['signal']:
-            networks[key] = {
-                'ssid': r.ssid,
-                'bssid': r.bssid,
-                'signal': r.signal,
-                'freq': getattr(r, 'freq', None)
-            }
-    return list(networks.values())
-
-def mock_scan_networks():
-    """Return a mocked list of networks for demo purposes."""
-    sample_ssids = [
-        "Cafe_Free_WiFi", "Home-Net_2.4G", "OfficeNet", "HiddenSSID", "Campus-Guest", "IoT-AP-123"
-    ]
-    nets = []
-    for i, s in enumerate(sample_ssids):
-        nets.append({
-            'ssid': s,
-            'bssid': f"02:00:00:00:0{i:02x}",
-            'signal': random.randint(-90, -30),
-            'freq': random.choice([2412, 2437, 2462, 5180])
-        })
-    return nets
-
-def append_log(entry: dict):
-    """Append JSON-line to local log file."""
-    with open(LOGFILE_NAME, "a") as f:
-        f.write(json.dumps(entry) + "\n")
-
-def load_all_logs():
-    try:
-        with open(LOGFILE_NAME, "r") as f:
-            lines = f.readlines()
-        entries = [json.loads(l) for l in lines]
-        return entries
-    except FileNotFoundError:
-        return []
+    def build():
+        with tempfile.TemporaryFile() as f:
+            export(log, EXPORT_FORMATS[fmt][0], f, ssid=ssid, bssid=bssid, since=since)
+            f.seek(0)
+            return f.read()
+    return build
 
 # ---- Streamlit UI ----
 st.set_page_config(page_title="Safe Wi-Fi Scanner & DoS Simulation", layout="wide")
+perf_timing.begin_rerun("dos_sim")
 st.title("📶 Safe Wi-Fi Scanner + DoS Simulation (Educational Demo)")
 
 st.markdown(
@@ -91,10 +126,31 @@ st.sidebar.header("Scan Controls")
 scan_btn = st.sidebar.button("Scan Nearby Wi-Fi")
 
 scan_timeout = st.sidebar.slider("Scan wait time (seconds)", min_value=1, max_value=8, value=3)
+scan_ttl = st.sidebar.slider("Scan cache TTL (seconds)", min_value=5, max_value=300, value=30, step=5)
 use_mock = st.sidebar.checkbox("Force mock scan (if pywifi failing)", value=not PYWIFI_AVAILABLE)
 
 # Show environment status
 st.sidebar.markdown(f"**pywifi available:** {PYWIFI_AVAILABLE}")
+st.sidebar.markdown(f"**Scan backend:** {'mock' if use_mock else default_backend()}")
+
+# Indexed search over saved runs (results are shown below the log table)
+st.sidebar.header("Search Saved Runs")
+log_index = get_log_index()
+q_ssid = st.sidebar.selectbox("SSID", ["(any)"] + log_index.distinct("ssid"))
+q_bssid = st.sidebar.selectbox("BSSID", ["(any)"] + log_index.distinct("bssid"))
+q_dates = st.sidebar.date_input("Date range (UTC)", value=())
+q_intensity = st.sidebar.slider("Intensity (pps)", min_value=0, max_value=5000, value=(0, 5000), step=10)
+q_page_size = st.sidebar.selectbox("Results per page", QUERY_PAGE_SIZES, index=1)
+query_filters = {
+    "ssid": None if q_ssid == "(any)" else q_ssid,
+    "bssid": None if q_bssid == "(any)" else q_bssid,
+    "min_intensity": q_intensity[0] or None,
+    "max_intensity": None if q_intensity[1] == 5000 else q_intensity[1],
+}
+if len(q_dates) >= 1:
+    query_filters["since"] = datetime.combine(q_dates[0], datetime.min.time())
+if len(q_dates) == 2:
+    query_filters["until"] = datetime.combine(q_dates[1], datetime.max.time())
 
 # Containers
 scan_col, sim_col = st.columns([1, 1])
@@ -106,13 +162,12 @@ with scan_col:
     if scan_btn:
         scan_placeholder.info("Scanning ... (this may take a few seconds)")
         try:
-            if not PYWIFI_AVAILABLE or use_mock:
+            # shared process-wide scanner (refreshed in the background)
+            backend = "mock" if use_mock else default_backend()
+            networks = get_scanner(backend, ttl=scan_ttl, timeout=scan_timeout, background=backend != "mock").get()
+            if not networks:
+                # fallback to mock if none found
                 networks = mock_scan_networks()
-            else:
-                networks = scan_networks_pywifi(timeout=scan_timeout)
-                if not networks:
-                    # fallback to mock if none found
-                    networks = mock_scan_networks()
             # present as dataframe
             df = pd.DataFrame(networks)
             # prettify signal column
@@ -151,12 +206,22 @@ with sim_col:
         selected_network = last_scan[selected_idx]
 
         st.markdown("**Simulation parameters**")
-        duration = st.slider("Duration (seconds)", min_value=5, max_value=120, value=20, step=5)
+        time_mode = st.selectbox("Time mode", list(TIME_MODES))
+        # compressed/instant runs can cover longer scenarios without waiting for them
+        max_duration = 120 if TIME_MODES[time_mode] == 1 else 3600
+        duration = st.slider("Duration (seconds)", min_value=5, max_value=max_duration, value=20, step=5)
         intensity = st.slider("Intensity (simulated packets per second)", min_value=10, max_value=5000, value=500, step=10)
         jitter = st.slider("Jitter (±% variability)", min_value=0, max_value=80, value=20, step=5)
 
         simulate_btn = st.button("Run Safe Simulation")
 
+        with st.expander("Batch parameter sweep"):
+            sweep_nets = st.multiselect("Networks", options, default=options)
+            sweep_durations = st.text_input("Durations (s)", value="10, 30, 60")
+            sweep_intensities = st.text_input("Intensities (pps)", value="100, 500, 1000, 5000")
+            sweep_jitters = st.text_input("Jitter (%)", value="0, 20, 40")
+            sweep_btn = st.button("Run sweep (instant, logged)")
+
         st.markdown("---")
         st.write("Selected network metadata:")
         st.json({
@@ -182,112 +247,201 @@ if 'simulate_running' not in st.session_state:
 if 'simulate_btn' not in locals():
     simulate_btn = False
 
-if simulate_btn and last_scan:
-    # start simulation
-    st.session_state['simulate_running'] = True
-    st.session_state['simulate_counter'] += 1
-
-    st.info("Simulation started — this is a SAFE visual simulation only.")
-    progress = st.progress(0)
-    status_text = st.empty()
-    chart_area = st.empty()
-    metrics_area = st.empty()
-
-    # Prepare time series for chart
-    timestamps = []
-    packets_sent_series = []
-    errors_series = []
-
-    start_time = time.time()
-    total_ticks = max(1, int(duration))  # update each second
-    packets_total = 0
-    errors_total = 0
-
-    for elapsed in range(0, duration):
-        # Simulate packets for this second with jitter
-        base_pps = intensity
-        jitter_fraction = jitter / 100.0
-        pps = int(base_pps * (1 + random.uniform(-jitter_fraction, jitter_fraction)))
-        # Simulate occasional errors proportional to intensity
-        error_chance = min(0.05, 0.0005 * base_pps)  # keep errors small
-        errors_this_tick = sum(1 for _ in range(max(0, pps//100)) if random.random() < error_chance)
-        packets_total += pps
-        errors_total += errors_this_tick
-
-        # append data
-        timestamps.append(elapsed)
-        packets_sent_series.append(packets_total)
-        errors_series.append(errors_total)
-
-        # Update chart and metrics
-        df_chart = pd.DataFrame({
-            "elapsed_s": timestamps,
-            "packets_total": packets_sent_series,
-            "errors_total": errors_series
-        }).set_index("elapsed_s")
-
-        chart_area.line_chart(df_chart)
-        metrics_area.markdown(
-            f"**Elapsed:** {elapsed+1}s  &nbsp;&nbsp; **Packets (total):** {packets_total}  &nbsp;&nbsp; **Errors (total):** {errors_total}"
+def cancel_simulation():
+    """Button callback: clearing simulate_running stops the worker right away."""
+    st.session_state['simulate_running'] = False
+    job = st.session_state.get('sim_job')
+    if job is not None:
+        job.cancel()
+
+def show_job(job):
+    """Progress bar, chart and totals of a simulation job (running or finished)."""
+    ring = job.ring
+    revealed = job.revealed
+    duration = max(1, job.duration)
+    st.progress(min(1.0, revealed/duration))
+    if revealed:
+        # chart reads the ring's aggregates: per-second while they cover the run, then per-10s / per-minute
+        res, points = ring.chart(CHART_POINT_BUDGET)
+        st.line_chart(pd.DataFrame({
+            "elapsed_s": points["elapsed_s"],
+            "packets_total": points["packets_total"],
+            "errors_total": points["errors_total"]
+        }).set_index("elapsed_s"))
+        if res > 1:
+            st.caption(f"Chart resolution: {res}s per point.")
+        st.markdown(
+            f"**Elapsed:** {revealed}s  &nbsp;&nbsp; **Packets (total):** {ring.packets_total}  &nbsp;&nbsp; **Errors (total):** {ring.errors_total}"
         )
 
-        # update progress
-        progress.progress(min(1.0, (elapsed+1)/duration))
-        status_text.text(f"Simulating... ({elapsed+1}/{duration} s)")
-
-        # sleep to simulate real-time (this keeps UI responsive)
-        time.sleep(1)
-
-    # Simulation finished
+def show_job_result(job):
+    """Final view of a reported job; rendered in the normal script run (no polling)."""
+    show_job(job)
+    if job.status == FINISHED and job.replay:
+        st.success(f"Replay complete — saved run from {job.final_entry.get('timestamp_utc')} (nothing re-logged).")
+    elif job.status == FINISHED:
+        final_entry = job.final_entry
+        st.success("Simulation complete (SIMULATION — no real traffic sent).")
+        st.success(f"Simulation finished — simulated packets: {final_entry['results']['packets_sent_simulated']}, simulated errors: {final_entry['results']['errors_simulated']}")
+        # Provide download of last log as JSON
+        json_str = json.dumps(final_entry, indent=2)
+        st.download_button("Download simulation log (JSON)", json_str, file_name=f"sim_log_{job.seed}.json", mime="application/json")
+    else:
+        st.warning(f"Simulation cancelled after {job.revealed}s." if job.error is None else f"Simulation failed: {job.error}")
+
+@poll_every(1)
+def simulation_progress():
+    """Lightweight view of the background job; re-polled every second until it is reported."""
+    job = st.session_state.get('sim_job')
+    if job is None or job.reported:
+        return
+    if job.running and not st.session_state['simulate_running']:
+        job.cancel()
+
+    show_job(job)
+    if job.running:
+        st.text(f"Simulating... ({job.revealed}/{job.duration} s)")
+        st.button("Cancel simulation", on_click=cancel_simulation, key=f"cancel_sim_{job.counter}")
+        return
+
+    # first poll after the worker stopped: publish result, refresh the log table;
+    # from then on the result is drawn by show_job_result() and polling stops
+    job.reported = True
     st.session_state['simulate_running'] = False
-    status_text.success("Simulation complete (SIMULATION — no real traffic sent).")
-    final_entry = {
-        "timestamp_utc": datetime.utcnow().isoformat() + "Z",
-        "network": {
-            "ssid": selected_network.get('ssid'),
-            "bssid": selected_network.get('bssid'),
-            "signal_dbm": selected_network.get('signal'),
-            "freq": selected_network.get('freq')
-        },
-        "simulation_params": {
-            "duration_s": duration,
-            "intensity_pps": intensity,
-            "jitter_percent": jitter
-        },
-        "results": {
-            "packets_sent_simulated": packets_total,
-            "errors_simulated": errors_total,
-            "note": "SIMULATION - no real packets were sent"
-        }
-    }
-
-    # Append to local log file and session
-    append_log(final_entry)
-    st.session_state['last_sim_result'] = final_entry
-
-    st.success(f"Simulation finished — simulated packets: {packets_total}, simulated errors: {errors_total}")
-
-    # Provide download of last log as JSON
-    json_str = json.dumps(final_entry, indent=2)
-    st.download_button("Download simulation log (JSON)", json_str, file_name=f"sim_log_{int(time.time())}.json", mime="application/json")
+    if job.status == FINISHED and not job.replay:
+        st.session_state['last_sim_result'] = job.final_entry
+    st.rerun()
+
+if simulate_btn and last_scan:
+    # start simulation in a background worker (previous run of this session is stopped)
+    previous = st.session_state.get('sim_job')
+    if previous is not None:
+        previous.cancel()
+    st.session_state['simulate_running'] = True
+    st.session_state['simulate_counter'] += 1
+    st.session_state['sim_job'] = SimulationJob(
+        st.session_state['simulate_counter'], selected_network, duration, intensity, jitter,
+        tick_seconds=tick_seconds_for(time_mode), on_done=get_log_writer().append_entry
+    ).start()
+
+if 'sweep_btn' in locals() and sweep_btn:
+    typed = [parse_int_list(sweep_durations), parse_int_list(sweep_intensities), parse_int_list(sweep_jitters)]
+    sweep_values = in_bounds(*typed)
+    sweep_runs = len(sweep_nets) * len(sweep_values[0]) * len(sweep_values[1]) * len(sweep_values[2])
+    if list(sweep_values) != typed:
+        st.warning(f"Values outside duration 1-{MAX_DURATION_S} s, intensity 1-{MAX_INTENSITY_PPS} pps "
+                   "or jitter 0-100 % were skipped.")
+    if sweep_runs > MAX_SWEEP_RUNS:
+        st.error(f"Sweep grid has {sweep_runs} runs — the limit is {MAX_SWEEP_RUNS}. Use fewer values.")
+        sweep_entries = None
+    else:
+        with st.spinner("Running parameter sweep across CPU cores ..."):
+            sweep_entries = run_sweep([last_scan[options.index(o)] for o in sweep_nets], *sweep_values)
+        if not sweep_entries:
+            st.warning("Sweep grid is empty — pick networks and enter at least one value per parameter.")
+    if sweep_entries:
+        append_logs(sweep_entries)
+        st.session_state['last_sweep'] = summary_frame(sweep_entries)
+
+if st.session_state.get('last_sweep') is not None:
+    st.subheader("Parameter Sweep Summary")
+    st.dataframe(st.session_state['last_sweep'])
+    st.download_button("Download sweep summary (.csv)", st.session_state['last_sweep'].to_csv(index=False),
+                       file_name="sweep_summary.csv", mime="text/csv")
+
+def run_label(entry):
+    """One-line description of a saved run for pickers."""
+    return (f"{entry.get('timestamp_utc') or entry.get('timestamp')} — "
+            f"{(entry.get('network') or {}).get('ssid') or '<hidden>'} "
+            f"({(entry.get('simulation_params') or {}).get('duration_s')} s)")
+
+def start_replay(entry, mode):
+    """Animate a saved log entry in the same progress view (no new log record)."""
+    previous = st.session_state.get('sim_job')
+    if previous is not None:
+        previous.cancel()
+    st.session_state['simulate_running'] = True
+    st.session_state['simulate_counter'] += 1
+    st.session_state['sim_job'] = SimulationJob.replay_entry(
+        st.session_state['simulate_counter'], entry, tick_seconds=tick_seconds_for(mode)
+    ).start()
+
+if st.session_state.get('sim_job') is not None:
+    if st.session_state['sim_job'].running:
+        if st.session_state['sim_job'].replay:
+            st.info("Replaying a saved simulation log.")
+        else:
+            st.info("Simulation running in the background — this is a SAFE visual simulation only.")
+    if st.session_state['sim_job'].reported:
+        show_job_result(st.session_state['sim_job'])
+    else:
+        simulation_progress()
 
 # Show last logs and export options
 st.markdown("---")
 st.subheader("Saved Simulation Logs")
-logs = load_all_logs()
-if logs:
+log_window = st.selectbox("Time window", list(LOG_WINDOWS))
+log_since = None
+if LOG_WINDOWS[log_window]:
+    log_since = datetime.utcnow() - timedelta(days=LOG_WINDOWS[log_window])
+df_logs = load_logs_frame()
+if log_since is not None:
+    df_logs = df_logs[df_logs["time_utc"] >= pd.Timestamp(log_since)]
+if get_log_archive().building:
+    st.caption("Compacting older log segments in the background — older runs appear shortly.")
+if not df_logs.empty:
     # show table with key columns
-    df_logs = pd.DataFrame([{
-        "time_utc": e.get("timestamp_utc") or e.get("timestamp"),
-        "ssid": e['network'].get('ssid'),
-        "bssid": e['network'].get('bssid'),
-        "duration_s": e['simulation_params'].get('duration_s'),
-        "packets_sim": e['results'].get('packets_sent_simulated')
-    } for e in logs])
-    st.dataframe(df_logs)
-
-    # allow download of all logs
-    all_json = "\n".join(json.dumps(e) for e in logs)
-    st.download_button("Download all logs (.jsonl)", all_json, file_name="all_sim_logs.jsonl", mime="application/json")
+    st.dataframe(df_logs[["time_utc", "ssid", "bssid", "duration_s", "packets_sim"]])
+
+    # export all logs in the window, streamed from disk in chunks
+    with st.expander("Export logs"):
+        export_fmt = st.selectbox("Format", list(EXPORT_FORMATS))
+        exp_ssid = st.text_input("Only SSID (optional)").strip() or None
+        exp_bssid = st.text_input("Only BSSID (optional)").strip() or None
+        if EXPORT_FORMATS[export_fmt][0] == "zip" and (exp_ssid or exp_bssid):
+            st.caption("Zip export copies whole segments; SSID/BSSID filters are ignored.")
+        export_mb = estimate_size(get_segmented_log(), EXPORT_FORMATS[export_fmt][0], since=log_since) / 1e6
+        if export_mb > MAX_DOWNLOAD_MB:
+            st.info(
+                f"This export can be up to {export_mb:.0f} MB; downloads from the app are limited to "
+                f"{MAX_DOWNLOAD_MB} MB. Pick a shorter time window, or run on the server:  \n"
+                f"`python sim_export.py --format {EXPORT_FORMATS[export_fmt][0]} --out all_sim_logs"
+                f"{EXPORT_FORMATS[export_fmt][1]}`"
+            )
+        else:
+            st.download_button(
+                "Download export", export_data(export_fmt, exp_ssid, exp_bssid, log_since),
+                file_name="all_sim_logs" + EXPORT_FORMATS[export_fmt][1],
+                mime="application/octet-stream", help=f"Up to {MAX_DOWNLOAD_MB} MB; larger exports: sim_export.py"
+            )
+
+    with st.expander("Replay a saved run"):
+        recent = recent_logs(REPLAY_CHOICES, since=log_since)
+        if recent:
+            st.caption(f"The {REPLAY_CHOICES} newest runs; older ones can be replayed from Search Saved Runs (sidebar).")
+            pick = st.selectbox("Saved run (newest first)", range(len(recent)), format_func=lambda i: run_label(recent[i]))
+            replay_mode = st.selectbox("Replay speed", list(TIME_MODES), index=1, key="replay_mode")
+            if st.button("Replay"):
+                start_replay(recent[pick], replay_mode)
+                st.rerun()
 else:
     st.info("No simulation logs yet. Run a simulation to create logs.")
+
+if any(v is not None for v in query_filters.values()):
+    st.subheader("Search Results")
+    total = get_log_index().count(**query_filters)
+    pages = max(1, -(-total // q_page_size))
+    page = st.number_input(f"Page (of {pages})", min_value=1, max_value=pages, value=1, step=1)
+    entries, total = query_logs(page - 1, q_page_size, **query_filters)
+    st.caption(f"{total} matching runs")
+    if entries:
+        st.dataframe(pd.DataFrame([flatten_entry(e) for e in entries]), hide_index=True)
+        # any indexed run can be replayed, not only the newest REPLAY_CHOICES
+        pick = st.selectbox("Replay a run from this page", range(len(entries)),
+                            format_func=lambda i: run_label(entries[i]), key="search_replay_pick")
+        search_mode = st.selectbox("Replay speed", list(TIME_MODES), index=1, key="search_replay_mode")
+        if st.button("Replay", key="search_replay"):
+            start_replay(entries[pick], search_mode)
+            st.rerun()
+
+perf_timing.sidebar_panel()
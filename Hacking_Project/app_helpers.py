@@ -0,0 +1,17 @@
+"""
+Small Streamlit helpers shared by the Wi-Fi apps.
+"""
+
+import streamlit as st
+
+
+def poll_every(seconds):
+    """st.fragment(run_every=...) where available; a plain call otherwise.
+
+    The fragment only keeps re-running while the script still calls it, so
+    callers stop calling it once there is nothing left to poll.
+    """
+    fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None)
+    if fragment is None:
+        return lambda fn: fn
+    return fragment(run_every=seconds)
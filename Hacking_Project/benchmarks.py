@@ -0,0 +1,280 @@
+"""
+Headless benchmark suite for the scanning, simulation and log pipelines.
+- Needs no Wi-Fi hardware: scans come from mock_scan_networks() or a recorded
+  netsh capture (--netsh-fixture); everything else is synthetic and seeded,
+  so two runs on the same machine measure the same work.
+- Each benchmark is timed `--repeat` times; best and median seconds plus a
+  throughput figure are written to a JSON baseline file.
+- --compare <old baseline> prints the ratio per benchmark and exits non-zero
+  when one got slower than --max-ratio. The baseline is left alone: results
+  are only written when --out is given and names another file.
+
+    python benchmarks.py --out bench_baseline.json
+    python benchmarks.py --full --compare bench_baseline.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import numpy as np
+
+from sim_engine import build_log_entry, iter_series, simulate_series
+from sim_logs import BATCH_ENTRIES, LogWriter, SegmentedLog
+from sim_series import SeriesRing
+from wifi_scan import dedupe_strongest, mock_scan_networks, parse_netsh_networks, strongest_by_ssid
+
+SEED = 1234
+LOG_SIZES = (10_000, 100_000)
+FULL_LOG_SIZES = (10_000, 100_000, 1_000_000)
+SIM_CASES = ((3600, 1000, 20), (86_400, 5000, 30))  # (duration_s, intensity_pps, jitter_percent)
+DEDUPE_SCANS = 2000        # mock scans merged into one dedupe input
+NETSH_SSIDS = 2000
+NETSH_BSSIDS_PER_SSID = 4
+DEFAULT_OUT = "bench_baseline.json"
+
+
+def timeit(fn, repeat, setup=None):
+    """Run fn() `repeat` times (setup() before each, untimed); return the timings.
+
+    Without setup, one untimed warm-up call comes first (imports, caches).
+    """
+    if setup is None:
+        fn()
+    times = []
+    for _ in range(repeat):
+        args = (setup(),) if setup is not None else ()
+        start = time.perf_counter()
+        fn(*args)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def result(name, times, items=None, unit="items", **params):
+    best = min(times)
+    row = {
+        "name": name,
+        "params": params,
+        "repeat": len(times),
+        "best_s": round(best, 6),
+        "median_s": round(statistics.median(times), 6),
+    }
+    if items:
+        row["throughput"] = round(items / best, 1)
+        row["unit"] = f"{unit}/s"
+    return row
+
+
+# ---- Fixtures (deterministic) ----
+def mock_scans(n_scans, seed=SEED):
+    random.seed(seed)
+    networks = []
+    for _ in range(n_scans):
+        networks.extend(mock_scan_networks())
+    return networks
+
+
+def synthetic_netsh(n_ssids=NETSH_SSIDS, per_ssid=NETSH_BSSIDS_PER_SSID, seed=SEED):
+    """A large `netsh wlan show network mode=Bssid` capture."""
+    rng = random.Random(seed)
+    lines = ["", "Interface name : Wi-Fi", f"There are {n_ssids} networks currently visible.", ""]
+    for i in range(n_ssids):
+        lines += [f"SSID {i + 1} : Net-{i:05d}", "    Network type            : Infrastructure",
+                  f"    Authentication          : {rng.choice(['WPA2-Personal', 'WPA3-Personal', 'Open'])}",
+                  "    Encryption              : CCMP"]
+        for j in range(per_ssid):
+            lines += [f"    BSSID {j + 1}                 : 02:{i >> 8 & 255:02x}:{i & 255:02x}:00:00:{j:02x}",
+                      f"         Signal             : {rng.randint(5, 100)}%",
+                      "         Radio type         : 802.11ax",
+                      f"         Channel            : {rng.choice([1, 6, 11, 36, 44, 149])}", ""]
+    return "\n".join(lines)
+
+
+def log_entries(n, seed=SEED):
+    rng = random.Random(seed)
+    nets = [{"ssid": f"Net-{i}", "bssid": f"02:00:00:00:00:{i:02x}", "signal": -40 - i, "freq": 2412}
+            for i in range(32)]
+    return [build_log_entry(rng.choice(nets), rng.randint(10, 120), rng.randint(10, 2000), rng.randint(0, 50),
+                            rng.randrange(2**32), rng.randint(0, 10**6), rng.randint(0, 500))
+            for _ in range(n)]
+
+
+# ---- Benchmarks ----
+def bench_scan_dedupe(repeat):
+    networks = mock_scans(DEDUPE_SCANS)
+    return [
+        result("scan.dedupe_strongest", timeit(lambda: dedupe_strongest(networks), repeat),
+               len(networks), "networks", scans=DEDUPE_SCANS),
+        result("scan.strongest_by_ssid", timeit(lambda: strongest_by_ssid(networks), repeat),
+               len(networks), "networks", scans=DEDUPE_SCANS),
+    ]
+
+
+def bench_netsh_parser(repeat, fixture=None):
+    if fixture:
+        with open(fixture, encoding="utf-8", errors="backslashreplace") as f:
+            text = f.read()
+        params = {"fixture": os.path.basename(fixture)}
+    else:
+        text = synthetic_netsh()
+        params = {"ssids": NETSH_SSIDS, "bssids_per_ssid": NETSH_BSSIDS_PER_SSID}
+    return [result("scan.parse_netsh", timeit(lambda: parse_netsh_networks(text), repeat),
+                   len(text) / 1e6, "MB", bytes=len(text), **params)]
+
+
+def bench_simulation(repeat):
+    rows = []
+    for duration, intensity, jitter in SIM_CASES:
+        params = {"duration_s": duration, "intensity_pps": intensity, "jitter_percent": jitter}
+        rows.append(result("sim.simulate_series",
+                           timeit(lambda: simulate_series(duration, intensity, jitter, SEED), repeat),
+                           duration, "sim-seconds", **params))
+
+        def stream():
+            ring = SeriesRing()
+            for pps, errors in iter_series(duration, intensity, jitter, SEED):
+                ring.extend(pps, errors)
+            ring.chart()
+        rows.append(result("sim.iter_series_into_ring", timeit(stream, repeat), duration, "sim-seconds", **params))
+    return rows
+
+
+def bench_logs(repeat, sizes):
+    rows = []
+    for n in sizes:
+        entries = log_entries(n)
+        tmp = tempfile.mkdtemp(prefix="wifi-bench-")
+        try:
+            path = os.path.join(tmp, "simulation_log.jsonl")
+
+            def fresh_log():
+                shutil.rmtree(tmp)
+                os.makedirs(tmp)
+                return SegmentedLog(path)
+
+            # bulk append (sweeps) and per-run append_entry (what the app does per finished run)
+            rows.append(result("logs.append_bulk", timeit(lambda log: log.append(entries), repeat, fresh_log),
+                               n, "entries", entries=n))
+            single = entries[:min(n, 10_000)]
+            rows.append(result("logs.append_entry",
+                               timeit(lambda log: [log.append_entry(e) for e in single], repeat, fresh_log),
+                               len(single), "entries", entries=len(single)))
+
+            def via_writer(log):
+                writer = LogWriter(log).start()
+                for e in single:
+                    writer.append_entry(e, wait=False)
+                writer.close()
+            rows.append(result("logs.writer_group_commit", timeit(via_writer, repeat, fresh_log),
+                               len(single), "entries", entries=len(single)))
+            # appended in writer-sized batches, so the fixture rotates into gzip segments like the app's log
+            log = fresh_log()
+            for start in range(0, n, BATCH_ENTRIES):
+                log.append(entries[start:start + BATCH_ENTRIES])
+            rows.append(result("logs.load_all", timeit(lambda: SegmentedLog(path).read(), repeat),
+                               n, "entries", entries=n, segments=len(log.manifest()["segments"])))
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+    return rows
+
+
+def bench_diagrams(repeat):
+    try:
+        from seminar_diagrams import BOOK_DIAGRAMS, render
+        render("crypto")  # pay the one-off matplotlib/networkx import outside the timings
+    except ImportError as e:
+        return [{"name": "diagram.render", "skipped": str(e)}]
+    rows = []
+    for kind, params in {kind: params for kind, params in BOOK_DIAGRAMS}.items():
+        for fmt in ("png", "svg"):
+            rows.append(result("diagram.render", timeit(lambda: render(kind, fmt, **params), repeat),
+                               kind=kind, fmt=fmt))
+    return rows
+
+
+def environment():
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "time_utc": datetime.utcnow().isoformat() + "Z",
+    }
+
+
+def run(repeat=3, full=False, netsh_fixture=None, only=None):
+    suites = {
+        "scan": lambda: bench_scan_dedupe(repeat) + bench_netsh_parser(repeat, netsh_fixture),
+        "sim": lambda: bench_simulation(repeat),
+        "logs": lambda: bench_logs(repeat, FULL_LOG_SIZES if full else LOG_SIZES),
+        "diagrams": lambda: bench_diagrams(repeat),
+    }
+    rows = []
+    for name, suite in suites.items():
+        if only and name not in only:
+            continue
+        print(f"running {name} ...", file=sys.stderr)
+        rows.extend(suite())
+    return {"environment": environment(), "seed": SEED, "full": full, "results": rows}
+
+
+def _key(row):
+    return row["name"], json.dumps(row.get("params", {}), sort_keys=True)
+
+
+def compare(baseline, current, max_ratio):
+    """Print current/baseline best-time ratios; returns the rows slower than max_ratio."""
+    old = {_key(r): r for r in baseline["results"] if "best_s" in r}
+    slower = []
+    for row in current["results"]:
+        prev = old.get(_key(row))
+        if prev is None or "best_s" not in row:
+            continue
+        ratio = row["best_s"] / prev["best_s"] if prev["best_s"] else float("inf")
+        flag = "  <-- slower" if ratio > max_ratio else ""
+        print(f"{row['name']:28} {json.dumps(row['params'], sort_keys=True):60} {prev['best_s']:>10.4f}s -> {row['best_s']:>10.4f}s  x{ratio:.2f}{flag}")
+        if ratio > max_ratio:
+            slower.append(row)
+    return slower
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Headless benchmarks (no Wi-Fi hardware needed).")
+    ap.add_argument("--out", help=f"baseline file to write (default {DEFAULT_OUT}; with --compare only if given)")
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--full", action="store_true", help="include the 1M-entry log benchmarks")
+    ap.add_argument("--only", nargs="+", choices=["scan", "sim", "logs", "diagrams"])
+    ap.add_argument("--netsh-fixture", help="recorded netsh capture to parse instead of a synthetic one")
+    ap.add_argument("--compare", help="earlier baseline to compare against")
+    ap.add_argument("--max-ratio", type=float, default=1.25, help="slow-down that counts as a regression")
+    args = ap.parse_args(argv)
+
+    out = args.out
+    if args.compare is None:
+        out = out or DEFAULT_OUT
+    elif out and os.path.abspath(out) == os.path.abspath(args.compare):
+        ap.error("--out must not be the --compare baseline")
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+    current = run(args.repeat, args.full, args.netsh_fixture, args.only)
+    if out:
+        with open(out, "w", encoding="utf-8") as f:
+            json.dump(current, f, indent=2)
+        print(f"wrote {out} ({len(current['results'])} results)", file=sys.stderr)
+    if baseline is not None and compare(baseline, current, args.max_ratio):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+"""
+Lightweight timing layer shared by the three Streamlit apps.
+- `timed(name)` works as a context manager or a decorator around hot paths
+  (scan wait, netsh subprocess, log loading, DataFrame building, diagram
+  rendering, ...).
+- Every timing goes into process-wide aggregates (count/sum/max per section);
+  timings taken on the script thread are also collected per rerun.
+- sidebar_panel() shows the current rerun's breakdown in a collapsible
+  sidebar expander; metrics can be written to a Prometheus text file
+  (snapshot) or a JSONL file (one line per rerun).
+
+PERF_METRICS_FILE=<path>.prom|<path>.jsonl writes metrics after every rerun.
+PERF_METRICS_DIR=<dir> enables the panel's "Write metrics" button, which
+writes perf_metrics.prom / perf_metrics.jsonl in that directory. File paths
+are only taken from the server environment, never from the browser.
+"""
+
+import contextlib
+import json
+import os
+import threading
+import time
+from datetime import datetime
+
+METRIC_NAME = "wifi_app_section_seconds"
+DEFAULT_EXPORT = {"prom": "perf_metrics.prom", "jsonl": "perf_metrics.jsonl"}
+
+_lock = threading.Lock()
+_stats = {}               # (app, section) -> [count, sum_s, max_s, last_s]
+_local = threading.local()
+_app = "app"
+
+
+class timed(contextlib.ContextDecorator):
+    """Time a block or function under `name`."""
+
+    def __init__(self, name):
+        self.name = name
+
+    def _recreate_cm(self):
+        # as a decorator: a fresh instance per call, so concurrent calls keep their own start time
+        return timed(self.name)
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        record(self.name, time.perf_counter() - self._start)
+        return False
+
+
+def record(name, seconds):
+    """Add one timing (seconds) to the aggregates and to the current rerun."""
+    with _lock:
+        s = _stats.setdefault((_app, name), [0, 0.0, 0.0, 0.0])
+        s[0] += 1
+        s[1] += seconds
+        s[2] = max(s[2], seconds)
+        s[3] = seconds
+    sections = getattr(_local, "sections", None)
+    if sections is not None:
+        sections.append((name, seconds))
+
+
+def begin_rerun(app):
+    """Call at the top of a script run: starts this thread's per-rerun breakdown."""
+    global _app
+    _app = app
+    _local.sections = []
+    _local.started = time.perf_counter()
+
+
+def end_rerun():
+    """Finish the current rerun; returns {"app", "ts", "rerun_ms", "sections"}."""
+    sections = getattr(_local, "sections", None) or []
+    started = getattr(_local, "started", None)
+    rerun_s = time.perf_counter() - started if started is not None else 0.0
+    _local.sections = None
+    record("rerun", rerun_s)
+    merged = {}
+    for name, seconds in sections:
+        merged[name] = merged.get(name, 0.0) + seconds
+    return {
+        "app": _app,
+        "ts": datetime.utcnow().isoformat() + "Z",
+        "rerun_ms": round(rerun_s * 1000, 2),
+        "sections": {name: round(s * 1000, 2) for name, s in merged.items()},
+    }
+
+
+def summary():
+    """Process-wide rows (app, section, count, total/avg/max/last ms), slowest total first."""
+    with _lock:
+        items = [(k, list(v)) for k, v in _stats.items()]
+    rows = [{
+        "app": app, "section": name, "count": n,
+        "total_ms": round(total * 1000, 1), "avg_ms": round(total / n * 1000, 2),
+        "max_ms": round(peak * 1000, 2), "last_ms": round(last * 1000, 2),
+    } for (app, name), (n, total, peak, last) in items]
+    rows.sort(key=lambda r: -r["total_ms"])
+    return rows
+
+
+def prometheus_text():
+    """Aggregates in Prometheus text exposition format (a summary per section)."""
+    lines = [
+        f"# HELP {METRIC_NAME} Time spent in instrumented app sections.",
+        f"# TYPE {METRIC_NAME} summary",
+    ]
+    maxima = []
+    with _lock:
+        items = sorted(_stats.items())
+    for (app, name), (n, total, peak, _last) in items:
+        labels = f'app="{app}",section="{name}"'
+        lines.append(f"{METRIC_NAME}_count{{{labels}}} {n}")
+        lines.append(f"{METRIC_NAME}_sum{{{labels}}} {total:.6f}")
+        maxima.append(f"{METRIC_NAME}_max{{{labels}}} {peak:.6f}")
+    lines += [f"# HELP {METRIC_NAME}_max Slowest single call per section.",
+              f"# TYPE {METRIC_NAME}_max gauge"] + maxima
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus(path):
+    """Atomically replace `path` with the current snapshot."""
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        f.write(prometheus_text())
+    os.replace(path + ".tmp", path)
+
+
+def append_jsonl(path, rerun):
+    """Append one rerun record as a JSON line."""
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(rerun) + "\n")
+
+
+def export(path, rerun):
+    """Write metrics to path: Prometheus snapshot for .prom/.txt, else a JSONL line."""
+    if path.endswith((".prom", ".txt")):
+        write_prometheus(path)
+    else:
+        append_jsonl(path, rerun)
+
+
+def export_target(fmt):
+    """Fixed export file for fmt inside PERF_METRICS_DIR (None when not configured)."""
+    directory = os.environ.get("PERF_METRICS_DIR")
+    return os.path.join(directory, DEFAULT_EXPORT[fmt]) if directory else None
+
+
+def sidebar_panel():
+    """Render the 'Performance' sidebar expander; call last in the script."""
+    import streamlit as st
+
+    rerun = end_rerun()
+    auto_path = os.environ.get("PERF_METRICS_FILE")
+    if auto_path:
+        try:
+            export(auto_path, rerun)
+        except OSError:
+            pass
+    with st.sidebar.expander("Performance"):
+        st.caption(f"This rerun: {rerun['rerun_ms']:.1f} ms")
+        if rerun["sections"]:
+            st.table([{"section": k, "ms": v} for k, v in
+                      sorted(rerun["sections"].items(), key=lambda kv: -kv[1])])
+        st.caption("Since process start")
+        st.dataframe(summary(), hide_index=True)
+        fmt = st.radio("Export format", list(DEFAULT_EXPORT), horizontal=True, key="perf_export_fmt")
+        path = export_target(fmt)
+        if path is None:
+            st.caption("Set PERF_METRICS_DIR on the server to write metrics files from here.")
+        elif st.button(f"Write {DEFAULT_EXPORT[fmt]}", key="perf_export"):
+            try:
+                if fmt == "jsonl":
+                    append_jsonl(path, rerun)
+                else:
+                    write_prometheus(path)
+                st.success(f"Wrote {DEFAULT_EXPORT[fmt]}")
+            except OSError as e:
+                st.error(f"Could not write {DEFAULT_EXPORT[fmt]}: {e}")
+        if auto_path:
+            st.caption(f"Also written after every rerun to {auto_path}.")
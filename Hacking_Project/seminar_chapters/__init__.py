@@ -0,0 +1,101 @@
+# Chapter registry for the Wi-Fi Security Knowledge Book
+# - Each chapter is its own module with TITLE and render(); a module is only
+#   imported the first time its chapter is visited.
+# - Load (import) and render times are recorded per chapter for the sidebar.
+
+import importlib
+import threading
+import time
+
+from perf_timing import timed
+
+# (title, module) in book order
+CHAPTER_MODULES = [
+    ("Intro", "intro"),
+    ("How Wi-Fi Security Works", "how_security_works"),
+    ("Scan Nearby Networks (Live)", "scan_networks"),
+    ("Show Saved Wi-Fi Passwords (Live, Your PC)", "saved_passwords"),
+    ("Forget a Wi-Fi Profile (Live, Your PC)", "forget_profile"),
+    ("Dictionary Attack (Safe Simulation)", "dictionary_attack"),
+    ("Glossary", "glossary"),
+    ("Best Practices", "best_practices"),
+]
+CHAPTERS = [title for title, _ in CHAPTER_MODULES]
+_MODULES = dict(CHAPTER_MODULES)
+# Text + fixed diagrams only: seminar_static.py pre-renders these to HTML.
+# The live (Windows/netsh) chapters stay in the interactive app.
+STATIC_CHAPTERS = [
+    "Intro",
+    "How Wi-Fi Security Works",
+    "Dictionary Attack (Safe Simulation)",
+    "Glossary",
+    "Best Practices",
+]
+
+
+def module_name(title):
+    return _MODULES[title]
+
+
+def index_for(module):
+    """Book position of the chapter stored in `module` (0 if unknown), for ?chapter= links."""
+    for i, (_, name) in enumerate(CHAPTER_MODULES):
+        if name == module:
+            return i
+    return 0
+
+
+_lock = threading.Lock()
+_loaded = {}
+# title -> {"load_ms", "last_render_ms", "max_render_ms", "renders"}
+STATS = {}
+
+
+def _stats(title):
+    return STATS.setdefault(title, {"load_ms": None, "last_render_ms": None, "max_render_ms": 0.0, "renders": 0})
+
+
+def load(title):
+    """Import a chapter module on first use (process-wide) and return it."""
+    module = _loaded.get(title)
+    if module is not None:
+        return module
+    with _lock:
+        module = _loaded.get(title)
+        if module is None:
+            start = time.perf_counter()
+            module = importlib.import_module(f"{__name__}.{_MODULES[title]}")
+            _stats(title)["load_ms"] = (time.perf_counter() - start) * 1000
+            _loaded[title] = module
+    return module
+
+
+def render(title):
+    """Render a chapter and record how long it took."""
+    module = load(title)
+    start = time.perf_counter()
+    try:
+        with timed(f"chapter.{_MODULES[title]}"):
+            module.render()
+    finally:
+        elapsed = (time.perf_counter() - start) * 1000
+        s = _stats(title)
+        s["last_render_ms"] = elapsed
+        s["max_render_ms"] = max(s["max_render_ms"], elapsed)
+        s["renders"] += 1
+
+
+def timings():
+    """Rows for a timing table, in book order (unvisited chapters included)."""
+    rows = []
+    for title in CHAPTERS:
+        s = STATS.get(title, {})
+        rows.append({
+            "chapter": title,
+            "loaded": title in _loaded,
+            "load_ms": None if s.get("load_ms") is None else round(s["load_ms"], 1),
+            "last_render_ms": None if s.get("last_render_ms") is None else round(s["last_render_ms"], 1),
+            "max_render_ms": round(s.get("max_render_ms", 0.0), 1),
+            "renders": s.get("renders", 0),
+        })
+    return rows
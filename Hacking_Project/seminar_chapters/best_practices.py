@@ -0,0 +1,22 @@
+# Chapter: Best Practices
+# Wi-Fi Security Knowledge Book (safe + legal demos only)
+
+import streamlit as st
+from seminar_helpers import draw_network_diagram
+
+TITLE = "Best Practices"
+
+
+def render():
+    st.header("🛡 Best Practices (Protect Your Wi-Fi)")
+    st.markdown("""
+- Use **WPA3** if available, else **WPA2-AES**.  
+- Create a long passphrase (3–4 random words + symbols).  
+- **Disable WPS** on the router.  
+- Update router firmware regularly.  
+- Change default admin username/password of the router.  
+- Separate **guest network** for visitors/IoT devices.  
+- Turn off unused services (remote mgmt, UPnP if not needed).  
+- Educate users about phishing and fake hotspots.
+    """)
+    draw_network_diagram("Hardened Home Network", risk=False)
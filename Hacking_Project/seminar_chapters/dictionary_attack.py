@@ -0,0 +1,78 @@
+# Chapter: Dictionary Attack (Safe Simulation)
+# Wi-Fi Security Knowledge Book (safe + legal demos only)
+
+import time
+import hashlib
+import streamlit as st
+from seminar_helpers import code_download_button, show_code_block, draw_attack_path_diagram
+
+TITLE = "Dictionary Attack (Safe Simulation)"
+
+
+def render():
+    st.header("📖 Dictionary Attack (Safe Simulation)")
+    tabs = st.tabs(["Explanation", "Live Demo", "Code"])
+
+    with tabs[0]:
+        st.write("""
+Real Wi-Fi cracking needs a captured handshake and specialized tools.  
+Here we simulate **hash guessing** to show why weak passwords are risky.
+        """)
+        st.info("No network traffic, no packet capture, no actual Wi-Fi involvement.")
+
+    with tabs[1]:
+        secret = st.text_input("Enter a demo secret (e.g., tiger@123)")
+        wl_default = ["123456", "password", "tiger", "tiger123", "tiger@123", "admin", "hello123"]
+        custom_list = st.text_area("Wordlist (optional, one per line)", value="\n".join(wl_default), height=140)
+
+        if st.button("▶️ Run Simulation"):
+            if not secret:
+                st.warning("Enter a secret first.")
+            else:
+                salt = "seminar-salt"
+                stored_hash = hashlib.sha256((salt + secret).encode()).hexdigest()
+                st.code(f"Stored Hash: {stored_hash}\nSalt: {salt}")
+
+                words = [w.strip() for w in custom_list.splitlines() if w.strip()]
+                start = time.time()
+                found = None
+                attempts = 0
+                prog = st.progress(0)
+                for i, word in enumerate(words, 1):
+                    attempts = i
+                    test_hash = hashlib.sha256((salt + word).encode()).hexdigest()
+                    if i % max(1, len(words)//100) == 0:
+                        prog.progress(min(100, int((i/len(words))*100)))
+                    if test_hash == stored_hash:
+                        found = (word, i, time.time() - start)
+                        break
+
+                if found:
+                    st.success(f"Found: {found[0]}  | Attempts: {found[1]}  | Time: {found[2]:.3f}s")
+                else:
+                    st.warning(f"Not found in {attempts} guesses. Use stronger passphrases!")
+
+        draw_attack_path_diagram()
+
+    with tabs[2]:
+        code = """
+import hashlib, time
+
+secret = input("Enter demo secret: ").strip()
+salt = "seminar-salt"
+stored_hash = hashlib.sha256((salt + secret).encode()).hexdigest()
+print("Hash =", stored_hash)
+
+wordlist = ["123456","password","tiger","tiger123","tiger@123","admin","hello123"]
+
+start = time.time()
+for i, word in enumerate(wordlist, 1):
+    test = hashlib.sha256((salt + word).encode()).hexdigest()
+    if test == stored_hash:
+        print(f"Found {word} in {i} guesses, time={time.time()-start:.3f}s")
+        break
+else:
+    print("Not found in small list.")
+        """
+        show_code_block(code)
+        code_download_button("dictionary_attack_simulation.py", code, key="dl_dict")
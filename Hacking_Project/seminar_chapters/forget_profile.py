@@ -0,0 +1,47 @@
+# Chapter: Forget a Wi-Fi Profile (Live, Your PC)
+# Wi-Fi Security Knowledge Book (safe + legal demos only)
+
+import subprocess
+import streamlit as st
+from seminar_helpers import code_download_button, show_code_block, draw_network_diagram, safe_windows_only
+
+TITLE = "Forget a Wi-Fi Profile (Live, Your PC)"
+
+
+def render():
+    st.header("🧹 Forget a Wi-Fi Profile (Your Windows PC)")
+    tabs = st.tabs(["Explanation", "Live Demo", "Code"])
+
+    with tabs[0]:
+        st.write("""
+Forgetting a profile removes stored credentials on **your** device. Good to show automation and hygiene.
+        """)
+
+    with tabs[1]:
+        if safe_windows_only():
+            profile_name = st.text_input("Wi-Fi profile name to forget")
+            if st.button("🗑️ Forget Profile"):
+                if not profile_name:
+                    st.warning("Enter a profile name.")
+                else:
+                    try:
+                        subprocess.run(
+                            ["netsh", "wlan", "delete", "profile", f"name={profile_name}"],
+                            check=True
+                        )
+                        st.success(f"Profile '{profile_name}' forgotten on this PC.")
+                    except Exception as e:
+                        st.error(f"Error: {e}")
+        draw_network_diagram("Profile Cleanup (Safe)")
+
+    with tabs[2]:
+        code = """
+import subprocess
+
+name = input("Profile to forget: ").strip()
+if name:
+    subprocess.run(["netsh", "wlan", "delete", "profile", f"name={name}"], check=True)
+    print(f"Forgot profile: {name}")
+        """
+        show_code_block(code)
+        code_download_button("forget_wifi_profile_windows.py", code, key="dl_forget")
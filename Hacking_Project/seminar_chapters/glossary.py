@@ -0,0 +1,22 @@
+# Chapter: Glossary
+# Wi-Fi Security Knowledge Book (safe + legal demos only)
+
+import streamlit as st
+from seminar_helpers import draw_crypto_overview
+
+TITLE = "Glossary"
+
+
+def render():
+    st.header("📚 Glossary (Student Friendly)")
+    st.markdown("""
+- **SSID**: Wi-Fi network name that devices see when scanning.  
+- **BSSID**: MAC address of the access point radio.  
+- **RSSI**: Signal strength indicator; higher (closer to 0) is stronger.  
+- **WPA2 / WPA3**: Security standards for encrypting Wi-Fi traffic.  
+- **Handshake**: Exchange between client and AP to derive session keys.  
+- **Dictionary Attack**: Trying many passwords from a list until one works.  
+- **WPS**: Wi-Fi Protected Setup; convenient but often risky — disable it.  
+- **Deauth**: A frame type that can disconnect clients (don’t do this; illegal without permission).  
+    """)
+    draw_crypto_overview()
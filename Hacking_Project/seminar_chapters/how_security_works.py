@@ -0,0 +1,39 @@
+# Chapter: How Wi-Fi Security Works
+# Wi-Fi Security Knowledge Book (safe + legal demos only)
+
+import streamlit as st
+from seminar_helpers import code_download_button, show_code_block, draw_crypto_overview
+
+TITLE = "How Wi-Fi Security Works"
+
+
+def render():
+    st.header("🔐 How Wi-Fi Security Works (High Level)")
+    tabs = st.tabs(["Explanation", "Diagram", "Code (Educational Snippets)"])
+
+    with tabs[0]:
+        st.write("""
+**Quick overview**
+- Modern Wi-Fi uses **WPA2 or WPA3**.
+- A 4-way handshake derives session keys, then frames are **encrypted**.
+- Attacks often rely on **weak passwords**, **misconfigurations**, or **social engineering**.
+- Real cracking requires captured handshakes and heavy compute — not included here.
+        """)
+        st.info("Focus your talk on password strength, firmware updates, and turning off WPS.")
+
+    with tabs[1]:
+        draw_crypto_overview()
+        st.caption("We avoid live capture. This is a conceptual diagram for class.")
+
+    with tabs[2]:
+        snippet = """
+# Pseudocode only — not capturing any traffic
+def handshake_overview():
+    ssid = "MyNetwork"
+    # 1) Client & AP share SSID; AP advertises network
+    # 2) 4-way handshake derives keys (PTK) based on passphrase & nonces
+    # 3) Encrypted traffic begins
+    pass
+        """
+        show_code_block(snippet)
+        code_download_button("handshake_overview.py", snippet, key="dl_hs")
@@ -0,0 +1,25 @@
+# Chapter: Intro
+# Wi-Fi Security Knowledge Book (safe + legal demos only)
+
+import streamlit as st
+from seminar_helpers import draw_network_diagram, draw_attack_path_diagram
+
+TITLE = "Intro"
+
+
+def render():
+    st.title("📘 Wi-Fi Security Knowledge Book (Student Edition)")
+    col1, col2 = st.columns([1, 1])
+    with col1:
+        st.markdown("""
+**What you'll learn**
+- How scanning works (listing nearby SSIDs)
+- How saved Wi-Fi passwords can be read on **your own** Windows PC
+- How to forget profiles from **your own** PC
+- Why weak passwords fail (safe dictionary simulation)
+        """)
+        st.markdown('<span class="kb-badge">Legal</span><span class="kb-badge">Beginner-friendly</span><span class="kb-badge">Live Demos</span>', unsafe_allow_html=True)
+    with col2:
+        draw_network_diagram("Your Home/College Network (Example)")
+
+    draw_attack_path_diagram()
@@ -0,0 +1,88 @@
+# Chapter: Show Saved Wi-Fi Passwords (Live, Your PC)
+# Wi-Fi Security Knowledge Book (safe + legal demos only)
+
+import subprocess
+import streamlit as st
+from seminar_helpers import code_download_button, show_code_block, draw_network_diagram, safe_windows_only
+
+TITLE = "Show Saved Wi-Fi Passwords (Live, Your PC)"
+
+
+def render():
+    st.header("🔑 Show Saved Wi-Fi Passwords (Your Windows PC)")
+    tabs = st.tabs(["Explanation", "Live Demo", "Code"])
+
+    with tabs[0]:
+        st.write("""
+On Windows, saved Wi-Fi profiles can be listed and shown (with key=clear) **for your own PC only**.
+Use this to teach how device compromise can expose stored keys.
+        """)
+        st.warning("Use this only on **your** computer during the seminar.")
+
+    with tabs[1]:
+        if safe_windows_only():
+            colA, colB = st.columns([1, 1])
+            with colA:
+                if st.button("📂 List Profiles"):
+                    try:
+                        profiles = subprocess.check_output(
+                            ["netsh", "wlan", "show", "profiles"]
+                        ).decode("utf-8", errors="backslashreplace").splitlines()
+                        names = [ln.split(":", 1)[1].strip()
+                                 for ln in profiles if "All User Profile" in ln]
+                        if names:
+                            st.table({"Saved Profiles": names})
+                        else:
+                            st.info("No profiles found.")
+                    except Exception as e:
+                        st.error(f"Error: {e}")
+
+            with colB:
+                target = st.text_input("Profile name to reveal password")
+                if st.button("🔐 Show Password"):
+                    if not target:
+                        st.warning("Enter a profile name first.")
+                    else:
+                        try:
+                            detail = subprocess.check_output(
+                                ["netsh", "wlan", "show", "profile", target, "key=clear"]
+                            ).decode("utf-8", errors="backslashreplace")
+                            pwd = ""
+                            for ln in detail.splitlines():
+                                if "Key Content" in ln:
+                                    pwd = ln.split(":", 1)[1].strip()
+                                    break
+                            st.success(f"Password: {pwd or '(blank/not stored)'}")
+                        except Exception as e:
+                            st.error(f"Error: {e}")
+        draw_network_diagram("Saved Password Risk (Concept)", risk=True)
+
+    with tabs[2]:
+        code = """
+import subprocess
+
+# List profiles
+profiles_out = subprocess.check_output(
+    ["netsh", "wlan", "show", "profiles"]
+).decode("utf-8", errors="backslashreplace").splitlines()
+
+profiles = [ln.split(":",1)[1].strip()
+            for ln in profiles_out if "All User Profile" in ln]
+print("Profiles:", profiles)
+
+# Show one password
+name = input("Profile to reveal: ").strip()
+if name:
+    detail = subprocess.check_output(
+        ["netsh", "wlan", "show", "profile", name, "key=clear"]
+    ).decode("utf-8", errors="backslashreplace")
+
+    pwd = ""
+    for ln in detail.splitlines():
+        if "Key Content" in ln:
+            pwd = ln.split(":", 1)[1].strip()
+            break
+    print("Password:", pwd or "(blank/not stored)")
+        """
+        show_code_block(code)
+        code_download_button("show_saved_wifi_passwords_windows.py", code, key="dl_saved")
@@ -0,0 +1,58 @@
+# Chapter: Scan Nearby Networks (Live)
+# Wi-Fi Security Knowledge Book (safe + legal demos only)
+
+import streamlit as st
+from wifi_scan import get_scanner
+from seminar_helpers import code_download_button, show_code_block, draw_network_diagram, safe_windows_only
+
+TITLE = "Scan Nearby Networks (Live)"
+
+
+def render():
+    st.header("📡 Scan Nearby Networks (Live)")
+    tabs = st.tabs(["Explanation", "Live Demo", "Code"])
+
+    with tabs[0]:
+        st.write("""
+Scanning lists visible SSIDs and sometimes BSSID/RSSI. This is **legal** and does **not** reveal passwords.
+On Windows we use `netsh wlan show network mode=bssid`.
+        """)
+
+    with tabs[1]:
+        if safe_windows_only():
+            if st.button("🔍 Scan Now"):
+                try:
+                    # shared, cached netsh scan (one netsh call for all students)
+                    networks = get_scanner("netsh").get()
+                    ssids = list(dict.fromkeys(n["ssid"] for n in networks if n["ssid"]))
+
+                    if ssids:
+                        st.success(f"Found {len(ssids)} network(s).")
+                        st.table({"SSID": ssids})
+                    else:
+                        st.warning("No networks found. Ensure Wi-Fi is on.")
+                except Exception as e:
+                    st.error(f"Scan failed: {e}")
+        draw_network_diagram("Scan Perspective (Safe)")
+
+    with tabs[2]:
+        code = """
+import subprocess
+
+out = subprocess.check_output(
+    ["netsh", "wlan", "show", "network", "mode=Bssid"],
+    stderr=subprocess.STDOUT
+).decode("utf-8", errors="backslashreplace")
+
+ssids = []
+for line in out.splitlines():
+    line = line.strip()
+    if line.startswith("SSID ") and ":" in line:
+        ssid = line.split(":", 1)[1].strip()
+        if ssid and ssid not in ssids:
+            ssids.append(ssid)
+
+print("\\n".join(ssids))
+        """
+        show_code_block(code)
+        code_download_button("scan_networks_windows.py", code, key="dl_scan")
@@ -0,0 +1,192 @@
+"""
+Pre-rendered diagrams for the Wi-Fi Security Knowledge Book.
+- Each diagram is rendered once per (kind, params, format) into PNG/SVG bytes
+  and shared by every session of the process.
+- Rendering uses matplotlib's object API (no pyplot global state), so it is
+  safe to call from several sessions at once.
+- The cache can be warmed at startup and persisted to disk between restarts.
+- matplotlib/networkx are imported on the first real render only; pages whose
+  diagrams come from the cache never pay for them.
+"""
+
+import hashlib
+import io
+import os
+import threading
+
+from perf_timing import timed
+
+RENDER_VERSION = 1     # bump when drawing code changes (invalidates disk cache)
+DIAGRAM_DPI = 150
+DIAGRAM_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".diagram_cache")
+
+# Every diagram the book shows; used to warm the cache at startup
+BOOK_DIAGRAMS = [
+    ("network", {"title": "Your Home/College Network (Example)", "risk": False}),
+    ("network", {"title": "Scan Perspective (Safe)", "risk": False}),
+    ("network", {"title": "Saved Password Risk (Concept)", "risk": True}),
+    ("network", {"title": "Profile Cleanup (Safe)", "risk": False}),
+    ("network", {"title": "Hardened Home Network", "risk": False}),
+    ("attack_path", {}),
+    ("crypto", {}),
+]
+
+
+def _draw_network(nx, ax, title="Wi-Fi Topology", risk=False):
+    """Simple network diagram with optional risk highlight."""
+    G = nx.Graph()
+    # Nodes
+    G.add_node("Router/AP", kind="ap")
+    G.add_node("Laptop", kind="client")
+    G.add_node("Phone", kind="client")
+    G.add_node("IoT Cam", kind="client")
+    # Edges
+    G.add_edge("Laptop", "Router/AP")
+    G.add_edge("Phone", "Router/AP")
+    G.add_edge("IoT Cam", "Router/AP")
+
+    pos = nx.spring_layout(G, seed=7)
+    node_colors = []
+    for n, data in G.nodes(data=True):
+        if data["kind"] == "ap":
+            node_colors.append("#10b981" if not risk else "#ef4444")
+        else:
+            node_colors.append("#3b82f6")
+    edge_colors = "#ef4444" if risk else "#94a3b8"
+
+    nx.draw(
+        G, pos, ax=ax, with_labels=True,
+        node_color=node_colors,
+        edge_color=edge_colors,
+        node_size=1800, font_color="white", font_size=10
+    )
+    ax.set_title(title)
+
+
+def _draw_attack_path(nx, ax):
+    """Shows a conceptual path: Scan -> Collect Info -> Target Weakness -> (Simulated) Crack."""
+    G = nx.DiGraph()
+    G.add_edge("Scan SSIDs", "Collect Metadata")
+    G.add_edge("Collect Metadata", "Pick Target (Weak/WPS)")
+    G.add_edge("Pick Target (Weak/WPS)", "Simulated Guessing\n(Demo Hash)")
+    pos = nx.spring_layout(G, seed=11)
+
+    nx.draw(
+        G, pos, ax=ax, with_labels=True,
+        node_color=["#60a5fa", "#34d399", "#f59e0b", "#a78bfa"][:len(G.nodes())],
+        node_size=1800, font_color="white", font_size=10, arrows=True
+    )
+    ax.set_title("Conceptual Attack Path (Theory Only)")
+
+
+def _draw_crypto(nx, ax):
+    """Mini diagram of WPA2/WPA3 at a very high level."""
+    G = nx.DiGraph()
+    G.add_node("Client")
+    G.add_node("AP")
+    G.add_edge("Client", "AP", label="Handshake\n(Nonce/Keys)")
+    G.add_edge("AP", "Client", label="Encrypted Frames\n(AES-CCMP/GCMP)")
+
+    pos = nx.spring_layout(G, seed=2)
+    nx.draw(
+        G, pos, ax=ax, with_labels=True,
+        node_color=["#0ea5e9", "#10b981"],
+        node_size=1800, font_color="white", font_size=10, arrows=True
+    )
+    edge_labels = nx.get_edge_attributes(G, 'label')
+    nx.draw_networkx_edge_labels(G, pos, ax=ax, edge_labels=edge_labels, font_size=9)
+    ax.set_title("WPA2/WPA3 (Very High Level)")
+
+
+# kind -> (draw function, figure size)
+DIAGRAMS = {
+    "network": (_draw_network, (5.4, 4.2)),
+    "attack_path": (_draw_attack_path, (6.2, 3.6)),
+    "crypto": (_draw_crypto, (5.2, 3.6)),
+}
+
+
+def _plotting():
+    """Deferred heavy imports (cached by Python after the first call)."""
+    import matplotlib
+    matplotlib.use("Agg")
+    from matplotlib.figure import Figure
+    import networkx as nx
+    return Figure, nx
+
+
+@timed("diagram.render")
+def render(kind, fmt="png", **params):
+    """Render one diagram to PNG or SVG bytes."""
+    Figure, nx = _plotting()
+    draw, figsize = DIAGRAMS[kind]
+    fig = Figure(figsize=figsize)
+    draw(nx, fig.add_subplot(), **params)
+    buf = io.BytesIO()
+    fig.savefig(buf, format=fmt, dpi=DIAGRAM_DPI, bbox_inches="tight")
+    return buf.getvalue()
+
+
+class DiagramCache:
+    """Rendered diagram bytes keyed by (kind, params, format), shared by all sessions."""
+
+    def __init__(self, cache_dir=DIAGRAM_CACHE_DIR, persist=True):
+        self.cache_dir = cache_dir
+        self.persist = persist
+        self._images = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(kind, fmt, params):
+        return (kind, fmt, tuple(sorted(params.items())))
+
+    def _disk_path(self, key):
+        digest = hashlib.sha1(repr((RENDER_VERSION,) + key).encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.cache_dir, f"{key[0]}-{digest}.{key[1]}")
+
+    def get(self, kind, fmt="png", **params):
+        key = self.key(kind, fmt, params)
+        data = self._images.get(key)
+        if data is not None:
+            return data
+        with self._lock:  # render each diagram once even under concurrent reruns
+            data = self._images.get(key)
+            if data is None:
+                data = self._load(key)
+            if data is None:
+                data = render(kind, fmt, **params)
+                self._save(key, data)
+            self._images[key] = data
+        return data
+
+    def _load(self, key):
+        if not self.persist:
+            return None
+        try:
+            with open(self._disk_path(key), "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _save(self, key, data):
+        if not self.persist:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            path = self._disk_path(key)
+            with open(path + ".tmp", "wb") as f:
+                f.write(data)
+            os.replace(path + ".tmp", path)
+        except OSError:
+            pass  # read-only install: keep the in-memory cache only
+
+    def warm(self, diagrams=BOOK_DIAGRAMS, fmt="png"):
+        """Render (or load from disk) every listed diagram; returns self."""
+        for kind, params in diagrams:
+            self.get(kind, fmt, **params)
+        return self
+
+    def warm_in_background(self, diagrams=BOOK_DIAGRAMS, fmt="png"):
+        """warm() in a daemon thread so the first page is not held up; returns self."""
+        threading.Thread(target=self.warm, args=(diagrams, fmt), name="diagram-warmup", daemon=True).start()
+        return self
@@ -0,0 +1,88 @@
+# Shared helpers for the Wi-Fi Security Knowledge Book chapters
+# By Aniket (safe + legal demos only)
+
+import platform
+from textwrap import dedent
+
+import streamlit as st
+
+from seminar_diagrams import DiagramCache
+
+IS_WINDOWS = platform.system() == "Windows"
+
+# Shared by the app and the static build (seminar_static.py)
+BOOK_CSS = """
+/* Subtle card feel */
+.block-container { padding-top: 1.2rem; }
+div[data-testid="stMarkdownContainer"] h2 { margin-top: .6rem; }
+div[data-testid="stStatusWidget"] { border-radius: 14px !important; }
+.kb-callout {
+  padding: 12px 16px; border-radius: 14px;
+  background: #f3f6ff; border: 1px solid #dbe3ff; margin-bottom: 10px;
+}
+.kb-note {
+  padding: 10px 14px; border-radius: 10px;
+  background: #f9f9fb; border: 1px dashed #d0d0d5; margin: 8px 0;
+}
+.kb-badge {
+  display:inline-block; padding:2px 8px; border-radius:100px;
+  font-size:12px; border:1px solid #ddd; margin-right:6px; background:#fff;
+}
+hr { border: none; border-top: 1px solid #eee; margin: 10px 0 4px 0;}
+.small { font-size: 13px; color:#6b7280; }
+pre, code { font-size: 13px !important; }
+"""
+
+SAFETY_NOTE_HTML = """
+<div class="kb-callout">
+<b>Safety note:</b> This app is for learning and demonstrations only.
+It does <b>not</b> hack other networks. Live features show information from your own system.
+Avoid real cracking, deauth, or packet injection. Stay ethical.
+</div>
+"""
+
+
+def code_download_button(filename: str, code: str, key: str):
+    st.download_button(
+        "Download code",
+        data=dedent(code).encode("utf-8"),
+        file_name=filename,
+        mime="text/x-python",
+        key=key
+    )
+
+
+def show_code_block(code: str):
+    st.code(dedent(code), language="python")
+
+
+@st.cache_resource
+def get_diagram_cache():
+    """Rendered diagrams shared by all sessions; warmed in the background at startup."""
+    return DiagramCache().warm_in_background()
+
+
+def show_diagram(kind, **params):
+    st.image(get_diagram_cache().get(kind, **params))
+
+
+def draw_network_diagram(title="Wi-Fi Topology", risk=False):
+    """Simple network diagram with optional risk highlight."""
+    show_diagram("network", title=title, risk=risk)
+
+
+def draw_attack_path_diagram():
+    """Shows a conceptual path: Scan -> Collect Info -> Target Weakness -> (Simulated) Crack."""
+    show_diagram("attack_path")
+
+
+def draw_crypto_overview():
+    """Mini diagram of WPA2/WPA3 at a very high level."""
+    show_diagram("crypto")
+
+
+def safe_windows_only():
+    if not IS_WINDOWS:
+        st.warning("This live demo uses Windows commands (netsh). Try on a Windows laptop with Wi-Fi enabled.")
+        return False
+    return True
@@ -0,0 +1,359 @@
+"""
+Static build of the Wi-Fi Security Knowledge Book.
+- Renders the text + diagram chapters (seminar_chapters.STATIC_CHAPTERS) to
+  plain HTML pages, with diagrams as PNG files and code snippets as
+  downloadable .py files, so a whole class can be served by any static file
+  server (python -m http.server, nginx, a shared drive) at no CPU cost.
+- Each chapter's own render() runs against StaticPage, a stand-in for the
+  few streamlit calls the chapters make, so the app and the static book
+  cannot drift apart.
+- Live chapters (and interactive parts of static ones) link to the
+  interactive app via ?chapter=<module>.
+
+    python seminar_static.py --out seminar_site --live-url http://teacher-pc:8501
+"""
+
+import argparse
+import contextlib
+import hashlib
+import html
+import os
+import re
+import shutil
+from textwrap import dedent
+
+import seminar_chapters
+import seminar_helpers
+from seminar_chapters import CHAPTER_MODULES, STATIC_CHAPTERS
+from seminar_helpers import BOOK_CSS, SAFETY_NOTE_HTML
+
+BOOK_TITLE = "Wi-Fi Security Knowledge Book"
+ASSET_DIR = "assets"
+BUILD_MARKER = ".seminar_static"  # marks an output directory this tool may clear
+
+# Page layout for the static pages (BOOK_CSS supplies the kb-* components)
+STATIC_CSS = """
+body { margin: 0; font-family: system-ui, -apple-system, "Segoe UI", sans-serif; color: #1f2937; }
+.kb-layout { display: flex; min-height: 100vh; }
+.kb-nav { width: 250px; flex: none; padding: 16px; background: #f7f8fb; border-right: 1px solid #eee; }
+.kb-nav ul { list-style: none; padding: 0; }
+.kb-nav li { margin: 6px 0; }
+.kb-nav .current { font-weight: 600; }
+main { flex: 1; max-width: 1100px; padding: 16px 32px; }
+.kb-cols { display: flex; gap: 24px; flex-wrap: wrap; }
+.kb-col { min-width: 280px; }
+.kb-tab { border-top: 1px solid #eee; margin-top: 12px; }
+.kb-warning { background: #fff8e6; border-color: #f5d48b; }
+.kb-success { background: #ecfdf3; border-color: #a6e9c2; }
+.kb-pager { display: flex; justify-content: space-between; margin: 24px 0 8px; }
+img { max-width: 100%; }
+pre { background: #f6f8fa; padding: 12px; border-radius: 8px; overflow-x: auto; }
+"""
+
+_BOLD = re.compile(r"\*\*(.+?)\*\*")
+_CODE = re.compile(r"`([^`]+)`")
+
+
+def _inline(text, allow_html):
+    if not allow_html:
+        text = html.escape(text, quote=False)
+    text = _CODE.sub(r"<code>\1</code>", text)
+    return _BOLD.sub(r"<strong>\1</strong>", text)
+
+
+def markdown_to_html(text, allow_html=False):
+    """The Markdown subset the chapters use: paragraphs, '- ' lists, **bold**,
+    `code` and trailing-double-space line breaks."""
+    text = dedent(text).strip("\n")
+    if allow_html and text.lstrip().startswith("<div"):
+        return text
+    out, para, items = [], [], []
+
+    def flush():
+        if para:
+            out.append("<p>" + "\n".join(para) + "</p>")
+            para.clear()
+        if items:
+            out.append("<ul>" + "".join(f"<li>{i}</li>" for i in items) + "</ul>")
+            items.clear()
+
+    for raw in text.splitlines():
+        line = raw.strip()
+        if not line:
+            flush()
+        elif line.startswith("- "):
+            if para:
+                flush()
+            items.append(_inline(line[2:], allow_html))
+        else:
+            if items:
+                flush()
+            para.append(_inline(line, allow_html) + ("<br>" if raw.endswith("  ") else ""))
+    flush()
+    return "\n".join(out)
+
+
+class _Block:
+    """An HTML element whose children are emitted inside `with block:`."""
+
+    def __init__(self, page, open_tag, close_tag):
+        self.page = page
+        self.open_tag = open_tag
+        self.close_tag = close_tag
+        self.parts = []
+
+    def __enter__(self):
+        self.page._stack.append(self.parts)
+        return self
+
+    def __exit__(self, *exc):
+        self.page._stack.pop()
+        return False
+
+    def html(self):
+        return self.open_tag + "".join(p if isinstance(p, str) else p.html() for p in self.parts) + self.close_tag
+
+
+class _Progress:
+    def progress(self, *args, **kwargs):
+        return self
+
+
+class StaticPage:
+    """Collects the streamlit calls of one chapter as HTML.
+
+    Covers what the static chapters use; widgets return their defaults and
+    leave a single 'open in the live app' note. Anything else raises, so a
+    chapter that grows new UI is noticed at build time.
+    """
+
+    def __init__(self, book, live_link=None):
+        self.book = book
+        self.live_link = live_link
+        self.root = _Block(self, "", "")
+        self._stack = [self.root.parts]
+        self._live_note = False
+
+    def _emit(self, part):
+        self._stack[-1].append(part)
+
+    def html(self):
+        return self.root.html()
+
+    # ---- text ----
+    def title(self, text, **kwargs):
+        self._emit(f"<h1>{html.escape(text)}</h1>")
+
+    def header(self, text, **kwargs):
+        self._emit(f"<h2>{html.escape(text)}</h2>")
+
+    def subheader(self, text, **kwargs):
+        self._emit(f"<h3>{html.escape(text)}</h3>")
+
+    def markdown(self, text, unsafe_allow_html=False, **kwargs):
+        self._emit(markdown_to_html(text, allow_html=unsafe_allow_html))
+
+    def write(self, *args, **kwargs):
+        for arg in args:
+            self.markdown(str(arg))
+
+    def caption(self, text, **kwargs):
+        self._emit(f'<p class="small">{_inline(text, False)}</p>')
+
+    def _callout(self, kind, text):
+        self._emit(f'<div class="kb-callout kb-{kind}">{markdown_to_html(text)}</div>')
+
+    def info(self, text, **kwargs):
+        self._callout("info", text)
+
+    def warning(self, text, **kwargs):
+        self._callout("warning", text)
+
+    def success(self, text, **kwargs):
+        self._callout("success", text)
+
+    def error(self, text, **kwargs):
+        self._callout("warning", text)
+
+    def code(self, body, language="python", **kwargs):
+        self._emit(f'<pre><code class="language-{language}">{html.escape(body.strip(chr(10)))}</code></pre>')
+
+    # ---- assets ----
+    def image(self, data, caption=None, **kwargs):
+        src = self.book.add_asset(data, "png", "diagrams")
+        self._emit(f'<figure><img src="{src}" alt="{html.escape(caption or "diagram")}"></figure>')
+
+    def download_button(self, label, data, file_name, mime=None, key=None, **kwargs):
+        data = data.encode("utf-8") if isinstance(data, str) else data
+        src = self.book.add_file(data, f"code/{file_name}")
+        self._emit(f'<p><a class="kb-badge" href="{src}" download="{html.escape(file_name)}">⬇ {html.escape(label)}</a></p>')
+
+    # ---- layout ----
+    def columns(self, spec, **kwargs):
+        weights = [1] * spec if isinstance(spec, int) else list(spec)
+        row = _Block(self, '<div class="kb-cols">', "</div>")
+        cols = [_Block(self, f'<div class="kb-col" style="flex: {w}">', "</div>") for w in weights]
+        row.parts.extend(cols)
+        self._emit(row)
+        return cols
+
+    def tabs(self, labels):
+        tabs = [_Block(self, f'<section class="kb-tab"><h3>{html.escape(label)}</h3>', "</section>") for label in labels]
+        for tab in tabs:
+            self._emit(tab)
+        return tabs
+
+    # ---- widgets: defaults + a pointer to the live app ----
+    def _interactive(self):
+        if self._live_note:
+            return
+        self._live_note = True
+        where = f'<a href="{html.escape(self.live_link)}">interactive app</a>' if self.live_link else "interactive app"
+        self._emit(f'<div class="kb-note">This part is interactive — try it in the {where}.</div>')
+
+    def text_input(self, label, value="", **kwargs):
+        self._interactive()
+        return value
+
+    def text_area(self, label, value="", **kwargs):
+        self._interactive()
+        return value
+
+    def button(self, label, **kwargs):
+        self._interactive()
+        return False
+
+    def progress(self, *args, **kwargs):
+        return _Progress()
+
+    def __getattr__(self, name):
+        raise NotImplementedError(f"st.{name} is not supported by the static build")
+
+
+@contextlib.contextmanager
+def _rendering_to(page, modules):
+    """Point the modules' `st` at page for the duration of one chapter."""
+    saved = [(m, m.st) for m in modules]
+    for m in modules:
+        m.st = page
+    try:
+        yield page
+    finally:
+        for m, st in saved:
+            m.st = st
+
+
+class StaticBook:
+    """Writes the static chapters, their assets and an index to out_dir."""
+
+    def __init__(self, out_dir, live_url=None):
+        self.out_dir = out_dir
+        self.live_url = live_url.rstrip("/") if live_url else None
+        self.written = []
+
+    def live_link(self, module):
+        return f"{self.live_url}/?chapter={module}" if self.live_url else None
+
+    def add_file(self, data, rel):
+        """Write bytes to <out>/assets/<rel> (once); returns the page-relative URL."""
+        path = os.path.join(self.out_dir, ASSET_DIR, rel)
+        if path not in self.written:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as f:
+                f.write(data)
+            self.written.append(path)
+        return f"{ASSET_DIR}/{rel}"
+
+    def add_asset(self, data, ext, folder):
+        """Content-addressed asset (identical diagrams are stored once)."""
+        return self.add_file(data, f"{folder}/{hashlib.sha1(data).hexdigest()[:16]}.{ext}")
+
+    def _nav(self, current=None):
+        items = []
+        for title, module in CHAPTER_MODULES:
+            label = html.escape(title)
+            if title in STATIC_CHAPTERS:
+                cls = ' class="current"' if title == current else ""
+                items.append(f'<li{cls}><a href="{module}.html">{label}</a></li>')
+            elif self.live_url:
+                items.append(f'<li><a href="{html.escape(self.live_link(module))}">{label}</a> <span class="small">(live app)</span></li>')
+            else:
+                items.append(f'<li>{label} <span class="small">(live app only)</span></li>')
+        return f'<nav class="kb-nav"><h2><a href="index.html">Chapters</a></h2><ul>{"".join(items)}</ul></nav>'
+
+    def _pager(self, title):
+        i = STATIC_CHAPTERS.index(title)
+        prev_link = next_link = "<span></span>"
+        if i > 0:
+            prev_link = f'<a href="{seminar_chapters.module_name(STATIC_CHAPTERS[i - 1])}.html">◀ Previous</a>'
+        if i < len(STATIC_CHAPTERS) - 1:
+            next_link = f'<a href="{seminar_chapters.module_name(STATIC_CHAPTERS[i + 1])}.html">Next ▶</a>'
+        return f'<div class="kb-pager">{prev_link}{next_link}</div>'
+
+    def _page(self, title, body, current=None):
+        return (
+            '<!doctype html>\n<html lang="en"><head><meta charset="utf-8">'
+            '<meta name="viewport" content="width=device-width, initial-scale=1">'
+            f"<title>{html.escape(title)} — {BOOK_TITLE}</title>"
+            f'<link rel="stylesheet" href="{ASSET_DIR}/book.css"></head>\n'
+            f'<body><div class="kb-layout">{self._nav(current)}<main>{SAFETY_NOTE_HTML}{body}'
+            '<p class="small">Built for seminars. Safe, legal, and beginner friendly.</p>'
+            "</main></div></body></html>\n"
+        )
+
+    def _write_page(self, name, text):
+        path = os.path.join(self.out_dir, name)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        self.written.append(path)
+
+    def render_chapter(self, title):
+        module_name = seminar_chapters.module_name(title)
+        module = seminar_chapters.load(title)
+        with _rendering_to(StaticPage(self, self.live_link(module_name)), [module, seminar_helpers]) as page:
+            module.render()
+        self._write_page(f"{module_name}.html", self._page(title, page.html() + self._pager(title), current=title))
+
+    def _prepare_out_dir(self, force=False):
+        """Clear out_dir only if an earlier build made it (BUILD_MARKER).
+
+        Any other non-empty directory is refused, or with force written into
+        without deleting anything.
+        """
+        if os.path.isdir(self.out_dir) and os.listdir(self.out_dir):
+            if os.path.exists(os.path.join(self.out_dir, BUILD_MARKER)):
+                shutil.rmtree(self.out_dir)
+            elif not force:
+                raise FileExistsError(f"{self.out_dir} is not empty and was not built by seminar_static.py "
+                                      "(use --force to write into it anyway)")
+        os.makedirs(self.out_dir, exist_ok=True)
+        with open(os.path.join(self.out_dir, BUILD_MARKER), "w", encoding="utf-8") as f:
+            f.write("Built by seminar_static.py; the whole directory is replaced on the next build.\n")
+
+    def build(self, force=False):
+        """Render every static chapter; returns the list of written files."""
+        self._prepare_out_dir(force)
+        self.add_file((BOOK_CSS + STATIC_CSS).encode("utf-8"), "book.css")
+        for title in STATIC_CHAPTERS:
+            self.render_chapter(title)
+        intro = "<h1>📘 " + BOOK_TITLE + "</h1><p>Pick a chapter from the list. Chapters marked " \
+                "<em>live app</em> run commands on your own PC and need the interactive app.</p>"
+        self._write_page("index.html", self._page(BOOK_TITLE, intro))
+        return self.written
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Build a static HTML copy of the Knowledge Book's text chapters.")
+    ap.add_argument("--out", default="seminar_site", help="output directory (replaced if an earlier build made it)")
+    ap.add_argument("--live-url", help="URL of the interactive app, for the live chapters, e.g. http://host:8501")
+    ap.add_argument("--force", action="store_true", help="write into a non-empty directory (nothing is deleted)")
+    args = ap.parse_args(argv)
+    try:
+        written = StaticBook(args.out, args.live_url).build(args.force)
+    except FileExistsError as e:
+        ap.error(str(e))
+    print(f"wrote {len(written)} files to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
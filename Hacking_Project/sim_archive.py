@@ -0,0 +1,227 @@
+"""
+Columnar archive for the simulation log (simulation_log.jsonl).
+- Older JSON-line entries are compacted into typed numpy columns saved as one
+  uncompressed .npz file (np.load(..., allow_pickle=False) reads it directly).
+- SSID/BSSID are dictionary-encoded (int32 codes + sorted unique values), the
+  timestamp is datetime64[us], numbers are int64/float64.
+- The archive covers the closed (gzip) segments of the SegmentedLog; the
+  active JSONL file is the small tail parsed incrementally per rerun. Each
+  closed segment is compacted once, when it first shows up in the manifest.
+"""
+
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+
+from perf_timing import timed
+
+ARCHIVE_NAME = "archive.npz"  # stored next to the segment manifest
+MISSING_INT = -1              # stored for missing integer fields
+
+CATEGORY_COLUMNS = ("ssid", "bssid")
+FLOAT_COLUMNS = ("signal_dbm", "freq")
+INT_COLUMNS = ("duration_s", "intensity_pps", "jitter_percent", "packets_sim", "errors_sim")
+
+
+def flatten_entry(e):
+    """Flatten one log entry into flat fields (archive columns + seed)."""
+    net = e.get("network") or {}
+    params = e.get("simulation_params") or {}
+    res = e.get("results") or {}
+    return {
+        "time_utc": e.get("timestamp_utc") or e.get("timestamp"),
+        "ssid": net.get("ssid"),
+        "bssid": net.get("bssid"),
+        "signal_dbm": net.get("signal_dbm"),
+        "freq": net.get("freq"),
+        "duration_s": params.get("duration_s"),
+        "intensity_pps": params.get("intensity_pps"),
+        "jitter_percent": params.get("jitter_percent"),
+        "seed": params.get("seed"),
+        "packets_sim": res.get("packets_sent_simulated"),
+        "errors_sim": res.get("errors_simulated"),
+    }
+
+
+def _to_datetime(ts):
+    if not ts:
+        return np.datetime64("NaT", "us")
+    try:
+        return np.datetime64(str(ts).rstrip("Z"), "us")
+    except ValueError:
+        return np.datetime64("NaT", "us")
+
+
+def empty_columns():
+    cols = {"time_utc": np.empty(0, dtype="datetime64[us]")}
+    for name in CATEGORY_COLUMNS:
+        cols[name + "_codes"] = np.empty(0, dtype=np.int32)
+        cols[name + "_values"] = np.empty(0, dtype="U1")
+    for name in FLOAT_COLUMNS:
+        cols[name] = np.empty(0, dtype=np.float64)
+    for name in INT_COLUMNS:
+        cols[name] = np.empty(0, dtype=np.int64)
+    return cols
+
+
+def num_rows(cols):
+    return len(cols["time_utc"])
+
+
+def entries_to_columns(entries):
+    """Convert a list of log entries into archive columns."""
+    if not entries:
+        return empty_columns()
+    rows = [flatten_entry(e) for e in entries]
+    cols = {"time_utc": np.array([_to_datetime(r["time_utc"]) for r in rows], dtype="datetime64[us]")}
+    for name in CATEGORY_COLUMNS:
+        raw = np.array([r[name] or "" for r in rows], dtype=str)
+        values, codes = np.unique(raw, return_inverse=True)
+        cols[name + "_codes"] = codes.astype(np.int32)
+        cols[name + "_values"] = values
+    for name in FLOAT_COLUMNS:
+        cols[name] = np.array([np.nan if r[name] is None else r[name] for r in rows], dtype=np.float64)
+    for name in INT_COLUMNS:
+        cols[name] = np.array([MISSING_INT if r[name] is None else r[name] for r in rows], dtype=np.int64)
+    return cols
+
+
+def concat_columns(a, b):
+    """Append columns b after a, merging the category dictionaries."""
+    if not num_rows(b):
+        return a
+    if not num_rows(a):
+        return b
+    out = {}
+    for key in a:
+        if key.endswith("_codes") or key.endswith("_values"):
+            continue
+        out[key] = np.concatenate([a[key], b[key]])
+    for name in CATEGORY_COLUMNS:
+        va, vb = a[name + "_values"], b[name + "_values"]
+        values = np.unique(np.concatenate([va, vb]))
+        remap_a = np.searchsorted(values, va).astype(np.int32)
+        remap_b = np.searchsorted(values, vb).astype(np.int32)
+        out[name + "_codes"] = np.concatenate([remap_a[a[name + "_codes"]], remap_b[b[name + "_codes"]]])
+        out[name + "_values"] = values
+    return out
+
+
+def save_archive(path, cols, segment_names, segment_rows):
+    """Write columns + covered segments atomically (tmp file + os.replace)."""
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        np.savez(
+            f,
+            segment_names=np.array(segment_names, dtype=str),
+            segment_rows=np.array(segment_rows, dtype=np.int64),
+            **cols
+        )
+    os.replace(tmp, path)
+
+
+def load_archive(path):
+    """Return (columns, segment_names, segment_rows); empty if there is no archive."""
+    try:
+        with np.load(path, allow_pickle=False) as z:
+            meta = ("segment_names", "segment_rows")
+            cols = {k: z[k] for k in z.files if k not in meta}
+            names = [str(n) for n in z["segment_names"]]
+            rows = [int(r) for r in z["segment_rows"]]
+    except (FileNotFoundError, OSError, ValueError, KeyError):
+        return empty_columns(), [], []
+    return cols, names, rows
+
+
+def slice_columns(cols, start):
+    """Drop the first `start` rows (categories are kept as they are)."""
+    return {k: (v if k.endswith("_values") else v[start:]) for k, v in cols.items()}
+
+
+@timed("logs.dataframe")
+def columns_to_frame(cols):
+    """Build the Saved Simulation Logs table from columns (no per-row Python)."""
+    df = pd.DataFrame({"time_utc": cols["time_utc"]})
+    for name in CATEGORY_COLUMNS:
+        df[name] = pd.Categorical.from_codes(cols[name + "_codes"], categories=cols[name + "_values"])
+    for name in FLOAT_COLUMNS + INT_COLUMNS:
+        df[name] = cols[name]
+    return df
+
+
+class LogArchive:
+    """Archive columns for closed segments + the active JSONL file.
+
+    Shared by all sessions (wrap in st.cache_resource). columns() returns the
+    combined columns. Segments dropped by retention are sliced off the front;
+    a newly closed segment is merged in place, a backlog of several (first
+    start) is compacted by a daemon thread while the view shows what is ready.
+    """
+
+    def __init__(self, log, archive_path=None):
+        self.log = log  # sim_logs.SegmentedLog
+        self.archive_path = archive_path or os.path.join(log.segment_dir, ARCHIVE_NAME)
+        self._lock = threading.Lock()
+        self.building = False
+        self._archive, self._names, self._rows = load_archive(self.archive_path)
+
+    def _sync_segments(self, segments):
+        """Match the archive to the manifest; returns segments still to compact."""
+        names = [s["file"] for s in segments]
+        # retention removed the oldest segments
+        drop = 0
+        while drop < len(self._names) and self._names[drop] not in names:
+            drop += 1
+        if drop:
+            self._archive = slice_columns(self._archive, sum(self._rows[:drop]))
+            self._names, self._rows = self._names[drop:], self._rows[drop:]
+        if names[:len(self._names)] != self._names:
+            # manifest does not extend the archive (rebuilt/edited): start over
+            self._archive, self._names, self._rows = empty_columns(), [], []
+        return segments[len(self._names):]
+
+    @timed("logs.columns")
+    def columns(self):
+        with self._lock:
+            pending = self._sync_segments(self.log.segments())
+            if len(pending) == 1 and not self.building:
+                self._compact(pending)
+            elif pending and not self.building:
+                self.building = True
+                threading.Thread(target=self._compact_background, args=(pending,), daemon=True).start()
+            archive = self._archive
+        return concat_columns(archive, entries_to_columns(self.log.active_entries()))
+
+    def frame(self):
+        return columns_to_frame(self.columns())
+
+    def _compact(self, segments):
+        """Merge segments into the archive and persist it (caller holds the lock)."""
+        for seg in segments:
+            cols = entries_to_columns(self.log.segment_entries(seg))
+            self._archive = concat_columns(self._archive, cols)
+            self._names.append(seg["file"])
+            self._rows.append(num_rows(cols))
+        save_archive(self.archive_path, self._archive, self._names, self._rows)
+
+    def _compact_background(self, segments):
+        try:
+            cols = empty_columns()
+            rows = []
+            for seg in segments:
+                part = entries_to_columns(self.log.segment_entries(seg))
+                cols = concat_columns(cols, part)
+                rows.append(num_rows(part))
+            names = [s["file"] for s in segments]
+            with self._lock:
+                # only merge if these segments still follow the archive directly
+                pending = [s["file"] for s in self._sync_segments(self.log.segments())]
+                if pending[:len(names)] == names:
+                    self._archive = concat_columns(self._archive, cols)
+                    self._names += names
+                    self._rows += rows
+                    save_archive(self.archive_path, self._archive, self._names, self._rows)
+        finally:
+            self.building = False
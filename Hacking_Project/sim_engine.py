@@ -0,0 +1,132 @@
+"""
+Simulation engine for the Safe DoS Simulation demo.
+- SIMULATION ONLY: produces numbers for charts and logs, sends nothing.
+- The packets/errors time series is computed with NumPy, either in one pass
+  (simulate_series) or chunk by chunk (iter_series) for long runs; both give
+  the same numbers for the same seed.
+"""
+
+import random
+from datetime import datetime
+
+import numpy as np
+
+MAX_ERROR_CHANCE = 0.05      # keep simulated errors small
+ERROR_CHANCE_PER_PPS = 0.0005
+PACKETS_PER_ERROR_TRIAL = 100  # one error "trial" per 100 simulated packets
+SERIES_CHUNK = 4096          # seconds generated per iter_series() chunk
+
+
+def new_seed():
+    """Fresh 32-bit seed; stored with the log entry so a run can be reproduced."""
+    return random.randrange(2**32)
+
+
+def error_chance(intensity):
+    return min(MAX_ERROR_CHANCE, ERROR_CHANCE_PER_PPS * intensity)
+
+
+def simulate_series(duration, intensity, jitter, seed=None):
+    """Return the full time series for one simulated run.
+
+    Per second: pps = intensity * (1 ± jitter%) (uniform), errors ~
+    Binomial(pps // 100, error_chance). Returns a dict of int64 arrays
+    (elapsed_s, pps, errors, packets_total, errors_total) plus the seed used.
+    """
+    if seed is None:
+        seed = new_seed()
+    n = max(0, int(duration))
+    rng = np.random.default_rng(seed)
+    jitter_fraction = jitter / 100.0
+    pps = (intensity * (1 + rng.uniform(-jitter_fraction, jitter_fraction, n))).astype(np.int64)
+    trials = np.maximum(0, pps // PACKETS_PER_ERROR_TRIAL)
+    errors = rng.binomial(trials, error_chance(intensity)).astype(np.int64)
+    return {
+        "seed": seed,
+        "elapsed_s": np.arange(n, dtype=np.int64),
+        "pps": pps,
+        "errors": errors,
+        "packets_total": np.cumsum(pps),
+        "errors_total": np.cumsum(errors),
+    }
+
+
+def iter_series(duration, intensity, jitter, seed, chunk=SERIES_CHUNK):
+    """Yield (pps, errors) int64 chunks of the run simulate_series() would return.
+
+    simulate_series draws all the jitter uniforms first and the binomials after
+    them, so a second generator advanced past the uniforms replays the binomial
+    stream chunk by chunk. Memory stays O(chunk) for any duration.
+    """
+    n = max(0, int(duration))
+    jitter_fraction = jitter / 100.0
+    chance = error_chance(intensity)
+    uniforms = np.random.default_rng(seed)
+    binomials = np.random.default_rng(seed)
+    binomials.bit_generator.advance(n)  # one 64-bit draw per uniform
+    for start in range(0, n, chunk):
+        m = min(chunk, n - start)
+        pps = (intensity * (1 + uniforms.uniform(-jitter_fraction, jitter_fraction, m))).astype(np.int64)
+        errors = binomials.binomial(np.maximum(0, pps // PACKETS_PER_ERROR_TRIAL), chance).astype(np.int64)
+        yield pps, errors
+
+
+def build_log_entry(network, duration, intensity, jitter, seed, packets_total, errors_total):
+    """Log record for one finished run (same shape as simulation_log.jsonl lines)."""
+    return {
+        "timestamp_utc": datetime.utcnow().isoformat() + "Z",
+        "network": {
+            "ssid": network.get('ssid'),
+            "bssid": network.get('bssid'),
+            "signal_dbm": network.get('signal'),
+            "freq": network.get('freq')
+        },
+        "simulation_params": {
+            "duration_s": duration,
+            "intensity_pps": intensity,
+            "jitter_percent": jitter,
+            "seed": seed
+        },
+        "results": {
+            "packets_sent_simulated": int(packets_total),
+            "errors_simulated": int(errors_total),
+            "note": "SIMULATION - no real packets were sent"
+        }
+    }
+
+
+def series_totals(series):
+    """(packets_total, errors_total) at the end of a simulate_series() result."""
+    if not len(series["packets_total"]):
+        return 0, 0
+    return int(series["packets_total"][-1]), int(series["errors_total"][-1])
+
+
+def _even_chunks(n, packets, errors, chunk):
+    for start in range(0, n, chunk):
+        t = np.arange(start, min(n, start + chunk) + 1, dtype=np.int64)
+        yield np.diff(packets * t // n), np.diff(errors * t // n)
+
+
+def iter_series_from_entry(entry, chunk=SERIES_CHUNK):
+    """(pps, errors) chunks for replaying a saved log entry (nothing is logged again).
+
+    Entries that carry a seed are regenerated exactly (checked against the
+    recorded totals in a first streaming pass); older entries without one get
+    their recorded totals spread evenly over the run.
+    """
+    params = entry.get("simulation_params") or {}
+    results = entry.get("results") or {}
+    n = max(0, int(params.get("duration_s") or 0))
+    packets = int(results.get("packets_sent_simulated") or 0)
+    errors = int(results.get("errors_simulated") or 0)
+    seed = params.get("seed")
+    if seed is not None and n:
+        args = (n, params.get("intensity_pps", 0), params.get("jitter_percent", 0), seed, chunk)
+        totals = [0, 0]
+        for pps, errs in iter_series(*args):
+            totals[0] += int(pps.sum())
+            totals[1] += int(errs.sum())
+        if totals == [packets, errors]:
+            return iter_series(*args)
+    return _even_chunks(n, packets, errors, chunk)
@@ -0,0 +1,178 @@
+"""
+Streaming export of the simulation log (active file + gzip segments).
+- Output is produced in fixed-size chunks straight from disk, one segment at
+  a time, so memory stays bounded however large the history is.
+- Formats: NDJSON, CSV (flattened fields) or a zip of the segment files.
+- Filters: SSID, BSSID and a time range (segments outside it are not opened).
+
+Command line (writes to stdout or --out):
+    python sim_export.py --format csv --ssid Cafe_Free_WiFi --since 2025-01-01
+"""
+
+import argparse
+import csv
+import gzip
+import io
+import json
+import os
+import sys
+import zipfile
+
+from sim_archive import flatten_entry
+from sim_logs import SegmentedLog, entry_time, in_window, parse_lines, time_key
+
+CHUNK_BYTES = 1 << 18  # 256 KB per yielded chunk
+CSV_FIELDS = ["time_utc", "ssid", "bssid", "signal_dbm", "freq", "duration_s",
+              "intensity_pps", "jitter_percent", "seed", "packets_sim", "errors_sim"]
+FORMATS = {"ndjson": ".jsonl", "csv": ".csv", "zip": ".zip"}
+ZIP_OVERHEAD = 1024  # per zip member: local/central headers + its manifest.json record
+
+
+def _sources(log, since=None, until=None):
+    """Binary line iterators: overlapping segments (oldest first), then the active file."""
+    for seg in log.segments(since, until):
+        with gzip.open(log.segment_path(seg), "rb") as f:
+            yield f
+    try:
+        with open(log.path, "rb") as f:
+            yield f
+    except FileNotFoundError:
+        return
+
+
+def _complete_lines(log, since=None, until=None):
+    for f in _sources(log, since, until):
+        for line in f:
+            if line.endswith(b"\n"):  # skip a line still being written
+                yield line
+
+
+def iter_entries(log, ssid=None, bssid=None, since=None, until=None):
+    """Matching entries, parsed one line at a time."""
+    since, until = time_key(since), time_key(until)
+    for line in _complete_lines(log, since, until):
+        entries = parse_lines(line)
+        if not entries:
+            continue
+        e = entries[0]
+        net = e.get("network") or {}
+        if ssid is not None and net.get("ssid") != ssid:
+            continue
+        if bssid is not None and net.get("bssid") != bssid:
+            continue
+        if not in_window(entry_time(e), since, until):
+            continue
+        yield e
+
+
+def _chunked(pieces, chunk_bytes):
+    buf, size = [], 0
+    for piece in pieces:
+        buf.append(piece)
+        size += len(piece)
+        if size >= chunk_bytes:
+            yield b"".join(buf)
+            buf, size = [], 0
+    if buf:
+        yield b"".join(buf)
+
+
+def iter_ndjson(log, ssid=None, bssid=None, since=None, until=None, chunk_bytes=CHUNK_BYTES):
+    """NDJSON chunks; without filters lines are copied through unparsed."""
+    if ssid is None and bssid is None and since is None and until is None:
+        lines = _complete_lines(log)
+    else:
+        lines = (json.dumps(e).encode("utf-8") + b"\n" for e in iter_entries(log, ssid, bssid, since, until))
+    yield from _chunked(lines, chunk_bytes)
+
+
+def iter_csv(log, ssid=None, bssid=None, since=None, until=None, chunk_bytes=CHUNK_BYTES):
+    """CSV chunks (header first) with the flattened entry fields."""
+    buf = io.StringIO()
+    writer = csv.DictWriter(buf, fieldnames=CSV_FIELDS, extrasaction="ignore")
+    writer.writeheader()
+    for e in iter_entries(log, ssid, bssid, since, until):
+        writer.writerow(flatten_entry(e))
+        if buf.tell() >= chunk_bytes:
+            yield buf.getvalue().encode("utf-8")
+            buf.seek(0)
+            buf.truncate()
+    if buf.tell():
+        yield buf.getvalue().encode("utf-8")
+
+
+def write_zip(log, fileobj, since=None, until=None):
+    """Zip the overlapping segment files as-is (already gzip) + the active file.
+
+    Works at segment granularity: SSID/BSSID filters do not apply here.
+    """
+    segments = log.segments(since, until)
+    with zipfile.ZipFile(fileobj, "w", zipfile.ZIP_STORED) as z:
+        z.writestr("manifest.json", json.dumps({"segments": segments}, indent=1))
+        for seg in segments:
+            z.write(log.segment_path(seg), arcname=seg["file"])
+        if os.path.exists(log.path):
+            z.write(log.path, arcname=os.path.basename(log.path))
+
+
+def estimate_size(log, fmt, since=None, until=None):
+    """Upper bound of an export's size in bytes, before SSID/BSSID filters.
+
+    NDJSON/CSV: raw bytes of the overlapping segments + the active file;
+    zip: the gzip segment files + the active file + headers/manifest.
+    """
+    try:
+        total = os.path.getsize(log.path)
+    except FileNotFoundError:
+        total = 0
+    if fmt == "zip":
+        total += ZIP_OVERHEAD
+    for seg in log.segments(since, until):
+        if fmt == "zip":
+            try:
+                total += os.path.getsize(log.segment_path(seg)) + ZIP_OVERHEAD
+            except FileNotFoundError:
+                continue
+        else:
+            total += seg.get("bytes", 0)
+    return total
+
+
+def export(log, fmt, fileobj, ssid=None, bssid=None, since=None, until=None):
+    """Stream one export format into a binary file object."""
+    if fmt == "zip":
+        write_zip(log, fileobj, since, until)
+        return
+    chunks = iter_csv if fmt == "csv" else iter_ndjson
+    for chunk in chunks(log, ssid, bssid, since, until):
+        fileobj.write(chunk)
+
+
+def date_bound(value, end=False):
+    """Date-only command-line bounds cover the whole day (--until 2025-01-01 keeps that day)."""
+    if value is not None and len(value) == 10:
+        return value + ("T23:59:59.999999Z" if end else "T00:00:00Z")
+    return value
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Export simulation logs (streaming).")
+    ap.add_argument("--log", default="simulation_log.jsonl")
+    ap.add_argument("--format", choices=sorted(FORMATS), default="ndjson")
+    ap.add_argument("--ssid")
+    ap.add_argument("--bssid")
+    ap.add_argument("--since", help="ISO time, e.g. 2025-01-01 or 2025-01-01T10:00:00Z")
+    ap.add_argument("--until")
+    ap.add_argument("--out", help="output file (default: stdout)")
+    args = ap.parse_args(argv)
+    log = SegmentedLog(args.log)
+    args.since, args.until = date_bound(args.since), date_bound(args.until, end=True)
+    if args.out:
+        with open(args.out, "wb") as f:
+            export(log, args.format, f, args.ssid, args.bssid, args.since, args.until)
+    else:
+        export(log, args.format, sys.stdout.buffer, args.ssid, args.bssid, args.since, args.until)
+
+
+if __name__ == "__main__":
+    main()
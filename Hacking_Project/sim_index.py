@@ -0,0 +1,235 @@
+"""
+SQLite index over the simulation log (simulation_log.jsonl + segments).
+- One row per run: timestamp, SSID, BSSID, intensity, duration and where
+  the JSON line lives (source file, byte offset, length). The log stays the
+  source of truth; the index only says which lines to read.
+- Kept up to date by SegmentedLog listener calls (append/rotate/retention),
+  i.e. by the app's LogWriter; sync() catches up with anything written without it
+  (older logs, other tools).
+- query() filters in SQL and reads only the matching lines of the page.
+"""
+
+import gzip
+import json
+import os
+import sqlite3
+import threading
+from collections import defaultdict
+
+from sim_logs import entry_time, parse_lines, time_key
+
+INDEX_SUFFIX = ".index.sqlite"
+ACTIVE = ""  # `source` of rows that live in the active JSONL file
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    ts TEXT NOT NULL,
+    ssid TEXT,
+    bssid TEXT,
+    intensity INTEGER,
+    duration INTEGER,
+    source TEXT NOT NULL,
+    offset INTEGER NOT NULL,
+    length INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_ts ON runs (ts);
+CREATE INDEX IF NOT EXISTS runs_ssid_ts ON runs (ssid, ts);
+CREATE INDEX IF NOT EXISTS runs_bssid_ts ON runs (bssid, ts);
+CREATE INDEX IF NOT EXISTS runs_intensity ON runs (intensity);
+CREATE INDEX IF NOT EXISTS runs_source ON runs (source);
+CREATE TABLE IF NOT EXISTS sources (
+    source TEXT PRIMARY KEY,
+    ident TEXT,
+    size INTEGER NOT NULL
+);
+"""
+
+
+def index_row(entry, source, offset, length):
+    network = entry.get("network") or {}
+    params = entry.get("simulation_params") or {}
+    return (entry_time(entry), network.get("ssid"), network.get("bssid"),
+            params.get("intensity_pps"), params.get("duration_s"), source, offset, length)
+
+
+def scan_lines(f, offset=0):
+    """(offset, length, entry) for each complete, parseable line from offset on."""
+    f.seek(offset)
+    for line in f:
+        if not line.endswith(b"\n"):
+            break  # writer still busy
+        entries = parse_lines(line)
+        if entries:
+            yield offset, len(line), entries[0]
+        offset += len(line)
+
+
+def _ident(path):
+    st = os.stat(path)
+    return f"{st.st_dev}:{st.st_ino}"
+
+
+class LogIndex:
+    """Index for one SegmentedLog; registers itself as a log listener."""
+
+    def __init__(self, log, path=None):
+        self.log = log
+        self.path = path or log.path + INDEX_SUFFIX
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+        # the log is the source of truth (sync() rebuilds), so skip per-commit fsyncs
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(SCHEMA)
+        log.listeners.append(self)
+        self.sync()
+
+    # ---- listener calls (made under the log lock) ----
+    def appended(self, entries, offset, lengths):
+        rows, pos = [], offset
+        for entry, length in zip(entries, lengths):
+            rows.append(index_row(entry, ACTIVE, pos, length))
+            pos += length
+        with self._lock, self._db:
+            size = self._source_size(ACTIVE)
+            if size != offset:
+                return  # index was behind: sync() re-reads the active file
+            self._db.executemany(
+                "INSERT INTO runs (ts, ssid, bssid, intensity, duration, source, offset, length)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            self._set_source(ACTIVE, _ident(self.log.path), pos)
+
+    def rotated(self, segment):
+        """The active file became `segment` (byte offsets are unchanged)."""
+        with self._lock, self._db:
+            self._db.execute("UPDATE runs SET source = ? WHERE source = ?", (segment["file"], ACTIVE))
+            self._db.execute("UPDATE sources SET source = ?, ident = NULL WHERE source = ?",
+                             (segment["file"], ACTIVE))
+            self._set_source(ACTIVE, None, 0)
+
+    def dropped(self, files):
+        with self._lock, self._db:
+            for name in files:
+                self._db.execute("DELETE FROM runs WHERE source = ?", (name,))
+                self._db.execute("DELETE FROM sources WHERE source = ?", (name,))
+
+    # ---- bookkeeping ----
+    def _source_size(self, source):
+        row = self._db.execute("SELECT size FROM sources WHERE source = ?", (source,)).fetchone()
+        return row[0] if row else 0
+
+    def _set_source(self, source, ident, size):
+        self._db.execute("INSERT OR REPLACE INTO sources (source, ident, size) VALUES (?, ?, ?)",
+                         (source, ident, size))
+
+    def _insert_lines(self, source, f, offset=0):
+        rows, end = [], offset
+        for pos, length, entry in scan_lines(f, offset):
+            rows.append(index_row(entry, source, pos, length))
+            end = pos + length
+        self._db.executemany(
+            "INSERT INTO runs (ts, ssid, bssid, intensity, duration, source, offset, length)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+        return end
+
+    def sync(self):
+        """Bring the index in line with the files on disk; returns self."""
+        with self.log.locked(), self._lock, self._db:
+            segments = {s["file"] for s in self.log.manifest()["segments"]}
+            known = {r[0] for r in self._db.execute("SELECT source FROM sources WHERE source != ?", (ACTIVE,))}
+            for name in known - segments:
+                self._db.execute("DELETE FROM runs WHERE source = ?", (name,))
+                self._db.execute("DELETE FROM sources WHERE source = ?", (name,))
+            for name in sorted(segments - known):
+                self._db.execute("DELETE FROM runs WHERE source = ?", (name,))
+                path = os.path.join(self.log.segment_dir, name)
+                try:
+                    with gzip.open(path, "rb") as f:
+                        self._set_source(name, None, self._insert_lines(name, f))
+                except OSError:
+                    continue  # removed meanwhile; picked up by the next sync
+            row = self._db.execute("SELECT ident, size FROM sources WHERE source = ?", (ACTIVE,)).fetchone()
+            ident, size = row if row else (None, 0)
+            try:
+                f = open(self.log.path, "rb")
+            except FileNotFoundError:
+                self._db.execute("DELETE FROM runs WHERE source = ?", (ACTIVE,))
+                self._set_source(ACTIVE, None, 0)
+                return self
+            with f:
+                st = os.fstat(f.fileno())
+                current = f"{st.st_dev}:{st.st_ino}"
+                if (ident is not None and ident != current) or st.st_size < size:
+                    self._db.execute("DELETE FROM runs WHERE source = ?", (ACTIVE,))
+                    size = 0
+                if st.st_size > size:
+                    size = self._insert_lines(ACTIVE, f, size)
+                self._set_source(ACTIVE, current, size)
+        return self
+
+    # ---- queries ----
+    @staticmethod
+    def _where(ssid=None, bssid=None, since=None, until=None, min_intensity=None, max_intensity=None):
+        clauses, args = [], []
+        for sql, value in (("ssid = ?", ssid), ("bssid = ?", bssid),
+                           ("ts >= ?", time_key(since)), ("ts <= ?", time_key(until)),
+                           ("intensity >= ?", min_intensity), ("intensity <= ?", max_intensity)):
+            if value is not None:
+                clauses.append(sql)
+                args.append(value)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), args
+
+    def count(self, **filters):
+        self.sync()
+        where, args = self._where(**filters)
+        with self._lock:
+            return self._db.execute(f"SELECT COUNT(*) FROM runs{where}", args).fetchone()[0]
+
+    def query(self, page=0, page_size=50, newest_first=True, **filters):
+        """(entries on this page, total matches). Filters: ssid, bssid, since,
+        until (datetimes or ISO strings), min_intensity, max_intensity."""
+        where, args = self._where(**filters)
+        order = "DESC" if newest_first else "ASC"
+        with self._lock:
+            total = self._db.execute(f"SELECT COUNT(*) FROM runs{where}", args).fetchone()[0]
+            rows = self._db.execute(
+                f"SELECT id, source, offset, length FROM runs{where} ORDER BY ts {order}, id {order}"
+                " LIMIT ? OFFSET ?", args + [page_size, page * page_size]).fetchall()
+        return self._read_rows(rows), total
+
+    def distinct(self, column):
+        """Sorted distinct values of ssid or bssid (for filter widgets)."""
+        if column not in ("ssid", "bssid"):
+            raise ValueError(column)
+        with self._lock:
+            return [r[0] for r in self._db.execute(
+                f"SELECT DISTINCT {column} FROM runs WHERE {column} IS NOT NULL ORDER BY {column}")]
+
+    def _read_rows(self, rows):
+        """Read just the indexed lines, one file open per source."""
+        by_source = defaultdict(list)
+        for row_id, source, offset, length in rows:
+            by_source[source].append((offset, length, row_id))
+        found = {}
+        for source, spots in by_source.items():
+            if source == ACTIVE:
+                opener, path = open, self.log.path
+            else:
+                opener, path = gzip.open, os.path.join(self.log.segment_dir, source)
+            try:
+                with opener(path, "rb") as f:
+                    for offset, length, row_id in sorted(spots):  # forward seeks only (gzip)
+                        f.seek(offset)
+                        try:
+                            found[row_id] = json.loads(f.read(length))
+                        except ValueError:
+                            continue
+            except OSError:
+                continue  # rotated/removed since the query; the next sync fixes the index
+        return [found[r[0]] for r in rows if r[0] in found]
+
+    def close(self):
+        if self in self.log.listeners:
+            self.log.listeners.remove(self)
+        self._db.close()
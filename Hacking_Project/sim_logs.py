@@ -0,0 +1,573 @@
+"""
+Simulation log helpers for the Safe DoS Simulation demo.
+- Log entries are JSON lines (one dict per line) in simulation_log.jsonl.
+- LogTail keeps the parsed entries and last byte offset between Streamlit
+  reruns, so only newly appended lines are parsed.
+- SegmentedLog rolls the active file over by size/age into gzip segments
+  (simulation_log.segments/), keeps a manifest of their time ranges and
+  applies retention limits. Appends and rotations hold an inter-process
+  lock (simulation_log.jsonl.lock), so several app processes can share a log.
+- LogWriter is a process-wide buffered writer: one thread group-commits
+  queued entries every N entries or T ms, with a choice of fsync policy.
+- No streamlit import here: the app wraps these in st.cache_resource.
+"""
+
+import atexit
+import contextlib
+import gzip
+import json
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+
+from perf_timing import timed
+
+try:
+    import fcntl
+    msvcrt = None
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+HEAD_FINGERPRINT_BYTES = 64  # first bytes of the file, used to spot rotation
+
+SEGMENT_MAX_BYTES = 1_000_000       # roll the active file over at ~1 MB ...
+SEGMENT_MAX_AGE_S = 24 * 3600       # ... or when its first entry is a day old
+RETAIN_SEGMENTS = 500               # keep at most this many closed segments
+RETAIN_DAYS = 180                   # and drop segments whose newest entry is older
+SEGMENT_DIR_SUFFIX = ".segments"
+MANIFEST_NAME = "manifest.json"
+SEGMENT_CACHE_SIZE = 8              # parsed segments kept in memory (LRU)
+LOCK_SUFFIX = ".lock"
+
+BATCH_ENTRIES = 256                 # group commit after this many queued entries ...
+BATCH_MS = 50                       # ... or this long after the first one
+FSYNC_NONE, FSYNC_BATCH, FSYNC_INTERVAL = "none", "batch", "interval"
+FSYNC_POLICIES = (FSYNC_NONE, FSYNC_BATCH, FSYNC_INTERVAL)
+FSYNC_INTERVAL_S = 1.0              # FSYNC_INTERVAL: at most one fsync per second
+
+
+def parse_lines(chunk: bytes):
+    """Parse complete JSON lines from a bytes chunk. Corrupt lines are skipped."""
+    entries = []
+    for line in chunk.splitlines():
+        if not line.strip():
+            continue
+        try:
+            entries.append(json.loads(line))
+        except ValueError:
+            # half-written or hand-edited line: skip instead of breaking the UI
+            continue
+    return entries
+
+
+class LogTail:
+    """Incremental reader for a JSON-lines log file.
+
+    read() only parses bytes appended since the previous call. A trailing line
+    without its newline is left for the next call (writer still busy). If the
+    file was rotated, replaced or truncated, the reader starts over from byte 0
+    and bumps `generation` so callers holding derived data can drop it.
+    start_offset skips bytes already handled elsewhere (e.g. the archive).
+    """
+
+    def __init__(self, path, start_offset=0):
+        self.path = path
+        self.generation = 0
+        self._lock = threading.Lock()  # one reader is shared by all sessions
+        self._reset(start_offset)
+
+    def _reset(self, offset=0, ident=None):
+        self.offset = offset
+        self.entries = []
+        self._ident = ident
+        self._head = b""
+
+    def _read_head(self, f):
+        f.seek(0)
+        return f.read(HEAD_FINGERPRINT_BYTES)
+
+    def read(self):
+        """Return all entries parsed so far (new list, shared entry dicts)."""
+        with self._lock:
+            try:
+                f = open(self.path, "rb")
+            except FileNotFoundError:
+                if self._ident is not None or self.offset:
+                    self._reset()
+                    self.generation += 1
+                return []
+            with f:
+                st = os.fstat(f.fileno())
+                ident = (st.st_dev, st.st_ino)
+                head = self._read_head(f)
+                # rotation: new inode, file shrank, or first bytes changed
+                rotated = (
+                    (self._ident is not None and ident != self._ident)
+                    or st.st_size < self.offset
+                    or head[:len(self._head)] != self._head
+                )
+                if rotated:
+                    self._reset(0, ident)
+                    self.generation += 1
+                self._ident = ident
+                if st.st_size > self.offset:
+                    f.seek(self.offset)
+                    chunk = f.read(st.st_size - self.offset)
+                    end = chunk.rfind(b"\n")
+                    if end >= 0:
+                        self.entries.extend(parse_lines(chunk[:end]))
+                        self.offset += end + 1
+                # only fingerprint bytes that were actually consumed
+                self._head = head[:min(self.offset, HEAD_FINGERPRINT_BYTES)]
+            return list(self.entries)
+
+
+def append_entries(path, entries, fsync=False):
+    """Append many entries with a single open/write (one JSON line each).
+
+    Returns (offset of the first new line, list of line lengths in bytes).
+    fsync=True waits until the data is on disk.
+    """
+    if not entries:
+        return 0, []
+    lines = [(json.dumps(e) + "\n").encode("utf-8") for e in entries]
+    with open(path, "ab") as f:
+        offset = f.tell()
+        f.write(b"".join(lines))
+        if fsync:
+            f.flush()
+            os.fsync(f.fileno())
+    return offset, [len(line) for line in lines]
+
+
+class FileLock:
+    """Exclusive inter-process lock on a side file (flock, or msvcrt on Windows).
+
+    Not re-entrant; threads of one process must serialise around it themselves.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._f = None
+
+    def __enter__(self):
+        if self._f is None:
+            self._f = open(self.path, "a+b")
+        if fcntl is not None:
+            fcntl.flock(self._f.fileno(), fcntl.LOCK_EX)
+        else:
+            self._f.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(self._f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue  # LK_LOCK gives up after ~10 s; keep waiting
+        return self
+
+    def __exit__(self, *exc):
+        if fcntl is not None:
+            fcntl.flock(self._f.fileno(), fcntl.LOCK_UN)
+        else:
+            self._f.seek(0)
+            msvcrt.locking(self._f.fileno(), msvcrt.LK_UNLCK, 1)
+        return False
+
+
+def entry_time(entry):
+    """ISO timestamp of an entry ('' if missing); ISO strings sort by time."""
+    return entry.get("timestamp_utc") or entry.get("timestamp") or ""
+
+
+def time_key(value):
+    """datetime or ISO string -> ISO string comparable with entry_time()."""
+    if value is None or isinstance(value, str):
+        return value
+    if value.tzinfo is not None:
+        value = (value - value.utcoffset()).replace(tzinfo=None)
+    return value.isoformat() + "Z"
+
+
+def in_window(ts, since=None, until=None):
+    return (since is None or ts >= since) and (until is None or ts <= until)
+
+
+def _segment_times(path):
+    """(first_ts, last_ts, entries) over the lines that parse; '' when no entry has a time.
+
+    Torn or hand-edited lines are skipped, so they cannot blank the segment's range.
+    """
+    first = last = ""
+    count = 0
+    with open(path, "rb") as f:
+        for line in f:
+            entries = parse_lines(line)
+            if not entries:
+                continue
+            count += 1
+            ts = entry_time(entries[0])
+            if ts:
+                first = min(first, ts) if first else ts
+                last = max(last, ts)
+    return first, last, count
+
+
+class SegmentedLog:
+    """Active JSONL file + gzip-compressed closed segments with a manifest.
+
+    append() rolls the active file over once it reaches max_bytes or its
+    first entry is older than max_age_s. Closed segments are listed in
+    <segment_dir>/manifest.json with their first/last timestamps, so
+    read(since, until) only opens segments overlapping the window.
+
+    listeners (e.g. a LogIndex) are told, under the log lock, about
+    appended(entries, offset, lengths), rotated(segment) and
+    dropped(segment_files).
+    """
+
+    def __init__(self, path, max_bytes=SEGMENT_MAX_BYTES, max_age_s=SEGMENT_MAX_AGE_S,
+                 retain_segments=RETAIN_SEGMENTS, retain_days=RETAIN_DAYS):
+        self.path = path
+        self.segment_dir = path + SEGMENT_DIR_SUFFIX
+        self.manifest_path = os.path.join(self.segment_dir, MANIFEST_NAME)
+        self.max_bytes = max_bytes
+        self.max_age_s = max_age_s
+        self.retain_segments = retain_segments
+        self.retain_days = retain_days
+        self._lock = threading.RLock()
+        self._active = LogTail(path)
+        self._active_first = (None, None)  # (file identity, first entry time)
+        self._manifest = (None, {"segments": []})  # (mtime_ns, manifest)
+        self._segment_cache = OrderedDict()
+        self._file_lock = FileLock(path + LOCK_SUFFIX)
+        self.listeners = []
+
+    # ---- writing ----
+    @contextlib.contextmanager
+    def locked(self):
+        """Hold the log against writers in this and other processes."""
+        with self._lock, self._file_lock:
+            yield self
+
+    def append(self, entries, fsync=False):
+        with self._lock, self._file_lock:
+            if self._should_rotate():
+                self._rotate_locked()
+            offset, lengths = append_entries(self.path, entries, fsync)
+            for listener in self.listeners:
+                listener.appended(entries, offset, lengths)
+
+    def append_entry(self, entry):
+        self.append([entry])
+
+    def fsync_active(self):
+        """fsync the active file (lines appended earlier with fsync=False)."""
+        with self._lock, self._file_lock:
+            try:
+                with open(self.path, "r+b") as f:
+                    os.fsync(f.fileno())
+            except FileNotFoundError:
+                pass
+
+    def maybe_rotate(self):
+        with self._lock, self._file_lock:
+            if self._should_rotate():
+                self._rotate_locked()
+
+    def _active_started(self):
+        """Timestamp of the active file's first entry (cached per file)."""
+        try:
+            with open(self.path, "rb") as f:
+                st = os.fstat(f.fileno())
+                ident = (st.st_dev, st.st_ino)
+                if self._active_first[0] != ident:
+                    entries = parse_lines(f.readline())
+                    self._active_first = (ident, entry_time(entries[0]) if entries else "")
+        except FileNotFoundError:
+            return None
+        return self._active_first[1]
+
+    def _should_rotate(self):
+        try:
+            size = os.path.getsize(self.path)
+        except FileNotFoundError:
+            return False
+        if size == 0:
+            return False
+        if size >= self.max_bytes:
+            return True
+        started = self._active_started()
+        cutoff = time_key(datetime.utcnow() - timedelta(seconds=self.max_age_s))
+        return bool(started) and started < cutoff
+
+    def _rotate_locked(self):
+        os.makedirs(self.segment_dir, exist_ok=True)
+        base = os.path.splitext(os.path.basename(self.path))[0]
+        name = f"{base}.{datetime.utcnow().strftime('%Y%m%dT%H%M%S%f')}.jsonl"
+        closed = os.path.join(self.segment_dir, name)
+        os.replace(self.path, closed)  # writers recreate the active file on next append
+        first_ts, last_ts, count = _segment_times(closed)
+        with open(closed, "rb") as src, gzip.open(closed + ".gz.tmp", "wb") as dst:
+            for block in iter(lambda: src.read(1 << 20), b""):
+                dst.write(block)
+        os.replace(closed + ".gz.tmp", closed + ".gz")
+        raw_bytes = os.path.getsize(closed)
+        os.remove(closed)
+        manifest = self.manifest()
+        segment = {
+            "file": name + ".gz",
+            "first_ts": first_ts,
+            "last_ts": last_ts,
+            "entries": count,
+            "bytes": raw_bytes,
+        }
+        manifest["segments"].append(segment)
+        for listener in self.listeners:
+            listener.rotated(segment)
+        self._apply_retention(manifest)
+        self._write_manifest(manifest)
+
+    def _apply_retention(self, manifest):
+        segments = manifest["segments"]
+        keep = segments[-self.retain_segments:] if self.retain_segments else list(segments)
+        if self.retain_days:
+            cutoff = time_key(datetime.utcnow() - timedelta(days=self.retain_days))
+            # a segment without a known time is never dropped by age
+            keep = [s for s in keep if not s["last_ts"] or s["last_ts"] >= cutoff]
+        kept = {s["file"] for s in keep}
+        dropped = [s["file"] for s in segments if s["file"] not in kept]
+        for name in dropped:
+            try:
+                os.remove(os.path.join(self.segment_dir, name))
+            except FileNotFoundError:
+                pass
+            self._segment_cache.pop(name, None)
+        manifest["segments"] = keep
+        if dropped:
+            for listener in self.listeners:
+                listener.dropped(dropped)
+
+    def _write_manifest(self, manifest):
+        tmp = self.manifest_path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(manifest, f, indent=1)
+        os.replace(tmp, self.manifest_path)
+
+    # ---- reading ----
+    def manifest(self):
+        """Current manifest (re-read only when the file changed on disk)."""
+        with self._lock:
+            try:
+                mtime = os.stat(self.manifest_path).st_mtime_ns
+            except FileNotFoundError:
+                return {"segments": []}
+            if self._manifest[0] != mtime:
+                with open(self.manifest_path) as f:
+                    self._manifest = (mtime, json.load(f))
+            return {"segments": list(self._manifest[1]["segments"])}
+
+    def segments(self, since=None, until=None):
+        """Closed segments (oldest first) whose time range overlaps the window."""
+        since, until = time_key(since), time_key(until)
+        return [
+            s for s in self.manifest()["segments"]
+            if not s["last_ts"] or (
+                    (since is None or s["last_ts"] >= since) and (until is None or s["first_ts"] <= until))
+        ]
+
+    def segment_path(self, segment):
+        return os.path.join(self.segment_dir, segment["file"])
+
+    def segment_entries(self, segment):
+        """Parsed entries of one closed segment (segments never change, so cached)."""
+        with self._lock:
+            entries = self._segment_cache.get(segment["file"])
+            if entries is not None:
+                self._segment_cache.move_to_end(segment["file"])
+                return entries
+        with gzip.open(self.segment_path(segment), "rb") as f:
+            entries = parse_lines(f.read())
+        with self._lock:
+            self._segment_cache[segment["file"]] = entries
+            while len(self._segment_cache) > SEGMENT_CACHE_SIZE:
+                self._segment_cache.popitem(last=False)
+        return entries
+
+    def active_entries(self):
+        return self._active.read()
+
+    def read(self, since=None, until=None):
+        """Entries in [since, until] (ISO strings or datetimes), oldest first."""
+        since, until = time_key(since), time_key(until)
+        out = []
+        for seg in self.segments(since, until):
+            out.extend(e for e in self.segment_entries(seg) if in_window(entry_time(e), since, until))
+        out.extend(e for e in self.active_entries() if in_window(entry_time(e), since, until))
+        return out
+
+    def recent(self, n, since=None):
+        """Newest n entries (newest first), opening segments only as needed."""
+        since = time_key(since)
+        out = [e for e in reversed(self.active_entries()) if in_window(entry_time(e), since)][:n]
+        for seg in reversed(self.segments(since)):
+            if len(out) >= n:
+                break
+            out.extend(e for e in reversed(self.segment_entries(seg)) if in_window(entry_time(e), since))
+        return out[:n]
+
+
+class _Commit:
+    """Handed back to a waiting append(): set once its batch is written."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.error = None
+
+
+class LogWriter:
+    """Process-wide buffered writer for a SegmentedLog.
+
+    append() queues entries; one writer thread takes everything queued (up
+    to batch_entries) and writes it with a single append (one lock, one
+    write, at most one fsync). A batch of only wait=False appends is held
+    up to batch_ms to collect more; waiting callers are never held back,
+    they share a write with whatever queued up during the previous one
+    (group commit).
+    fsync: FSYNC_NONE (OS decides), FSYNC_BATCH (every batch) or
+    FSYNC_INTERVAL (at most every fsync_interval_s, and once more that long
+    after the last batch, so data written before the writer goes idle is
+    synced too).
+    When a write fails, waiting callers get the error and their entries are
+    dropped (they may retry); entries of wait=False appends, whose callers
+    cannot be told, are retried with the next batch.
+    """
+
+    def __init__(self, log, batch_entries=BATCH_ENTRIES, batch_ms=BATCH_MS,
+                 fsync=FSYNC_BATCH, fsync_interval_s=FSYNC_INTERVAL_S):
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"fsync must be one of {FSYNC_POLICIES}")
+        self.log = log
+        self.batch_entries = batch_entries
+        self.batch_ms = batch_ms
+        self.fsync = fsync
+        self.fsync_interval_s = fsync_interval_s
+        self.batches = 0
+        self.entries_written = 0
+        self.error = None
+        self._queue = queue.Queue()
+        self._retry = []
+        self._last_fsync = 0.0
+        self._unsynced = False  # FSYNC_INTERVAL: written since the last fsync
+        self._thread = threading.Thread(target=self._run, name="sim-log-writer", daemon=True)
+        self._closed = False
+
+    def start(self):
+        self._thread.start()
+        atexit.register(self.close)
+        return self
+
+    def append(self, entries, wait=True, timeout=None):
+        """Queue entries; with wait=True block until they are written (or raise)."""
+        commit = _Commit() if wait else None
+        self._queue.put((list(entries), commit))
+        if commit is not None:
+            if not commit.done.wait(timeout):
+                raise TimeoutError("log write still pending")
+            if commit.error is not None:
+                raise commit.error
+
+    def append_entry(self, entry, wait=True):
+        self.append([entry], wait)
+
+    def flush(self, timeout=None):
+        """Block until everything queued so far is written."""
+        self.append([], wait=True, timeout=timeout)
+
+    def close(self):
+        """Write what is queued and stop the thread (also run at exit)."""
+        if self._closed or not self._thread.is_alive():
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+
+    def _idle_timeout(self):
+        """How long the writer may sleep before the pending interval fsync is due."""
+        if not self._unsynced:
+            return None
+        return max(0.0, self._last_fsync + self.fsync_interval_s - time.monotonic())
+
+    def _run(self):
+        stop = False
+        while not stop:
+            try:
+                item = self._queue.get(timeout=self._idle_timeout())
+            except queue.Empty:
+                self._fsync_idle()
+                continue
+            retry, items = self._retry, []
+            size = len(retry)
+            deadline = time.monotonic() + self.batch_ms / 1000
+            while True:
+                if item is None:
+                    stop = True
+                    break
+                items.append(item)
+                size += len(item[0])
+                if size >= self.batch_entries:
+                    break
+                remaining = deadline - time.monotonic()
+                try:
+                    if any(commit is not None for _, commit in items) or remaining <= 0:
+                        # someone is waiting: take only what is already queued
+                        item = self._queue.get_nowait()
+                    else:
+                        item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+            batch = list(retry)
+            for entries, _ in items:
+                batch.extend(entries)
+            error = self._commit(batch)
+            # on failure keep only the entries nobody is told about
+            self._retry = [] if error is None else retry + [
+                e for entries, commit in items if commit is None for e in entries]
+            for _, commit in items:
+                if commit is not None:
+                    commit.error = error
+                    commit.done.set()
+        if self._unsynced:
+            self._fsync_idle()
+
+    def _fsync_idle(self):
+        self._last_fsync = time.monotonic()  # a failed fsync is retried an interval later
+        try:
+            self.log.fsync_active()
+        except OSError as e:
+            self.error = e
+            return
+        self._unsynced = False
+
+    def _commit(self, batch):
+        if not batch:
+            return None
+        now = time.monotonic()
+        fsync = self.fsync == FSYNC_BATCH or (
+            self.fsync == FSYNC_INTERVAL and now - self._last_fsync >= self.fsync_interval_s)
+        try:
+            with timed("logs.write_batch"):
+                self.log.append(batch, fsync=fsync)
+        except Exception as e:
+            self.error = e
+            return e
+        if fsync:
+            self._last_fsync = now
+        self._unsynced = self.fsync == FSYNC_INTERVAL and not fsync
+        self.error = None
+        self.batches += 1
+        self.entries_written += len(batch)
+        return None
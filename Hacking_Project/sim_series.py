@@ -0,0 +1,147 @@
+"""
+Time-series helpers for the simulation charts.
+- LTTB (Largest-Triangle-Three-Buckets) downsampling to a fixed point budget,
+  so chart payloads stay flat no matter how long a run is.
+- SeriesRing: fixed-capacity, array-backed ring buffers holding a run at
+  per-second, per-10s and per-minute resolution, so memory per run is
+  constant however long it goes on.
+"""
+
+import threading
+
+import numpy as np
+
+CHART_POINT_BUDGET = 300  # max points sent to the browser per chart
+RESOLUTIONS = (1, 10, 60)  # seconds per aggregate point
+RING_CAPACITY = 600        # points kept per resolution (10 min / 100 min / 10 h)
+
+
+def lttb_indices(x, y, n_out):
+    """Indices of the points LTTB keeps from (x, y), always including both ends.
+
+    Returns all indices when the series already fits in n_out points.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    # n_out - 2 buckets between the fixed first and last points
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0] = 0
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], max(edges[i + 1], edges[i] + 1)
+        # average of the next bucket (or the last point for the final bucket)
+        nstart, nend = end, (edges[i + 2] if i + 2 < len(edges) else n)
+        avg_x = x[nstart:nend].mean() if nend > nstart else x[-1]
+        avg_y = y[nstart:nend].mean() if nend > nstart else y[-1]
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(np.argmax(area))
+        keep[i + 1] = a
+    keep[-1] = n - 1
+    return keep
+
+
+class _Level:
+    """One resolution: a ring of buckets of `res` seconds each."""
+
+    def __init__(self, res, capacity):
+        self.res = res
+        self.capacity = capacity
+        self.buckets = 0  # buckets started so far; the newest may still be filling
+        self.packets = np.zeros(capacity, dtype=np.int64)
+        self.errors = np.zeros(capacity, dtype=np.int64)
+        self.packets_total = np.zeros(capacity, dtype=np.int64)  # running totals at bucket end
+        self.errors_total = np.zeros(capacity, dtype=np.int64)
+
+    def extend(self, t, pps, errors, packets_total, errors_total):
+        b = t // self.res
+        starts = np.flatnonzero(np.r_[True, b[1:] != b[:-1]])
+        ends = np.r_[starts[1:], len(b)] - 1
+        ids = b[starts]
+        packets = np.add.reduceat(pps, starts)
+        errs = np.add.reduceat(errors, starts)
+        if self.buckets and ids[0] == self.buckets - 1:
+            # first seconds belong to the bucket that is still filling
+            slot = ids[0] % self.capacity
+            self.packets[slot] += packets[0]
+            self.errors[slot] += errs[0]
+            self.packets_total[slot] = packets_total[ends[0]]
+            self.errors_total[slot] = errors_total[ends[0]]
+            ids, packets, errs, ends = ids[1:], packets[1:], errs[1:], ends[1:]
+        ids, packets, errs, ends = (a[-self.capacity:] for a in (ids, packets, errs, ends))
+        slots = ids % self.capacity
+        self.packets[slots] = packets
+        self.errors[slots] = errs
+        self.packets_total[slots] = packets_total[ends]
+        self.errors_total[slots] = errors_total[ends]
+        self.buckets = int(b[-1]) + 1
+
+    def points(self, count):
+        """Retained buckets, oldest first; elapsed_s is each bucket's last second."""
+        n = min(self.buckets, self.capacity)
+        ids = np.arange(self.buckets - n, self.buckets, dtype=np.int64)
+        slots = ids % self.capacity
+        return {
+            "elapsed_s": np.minimum(ids * self.res + self.res - 1, count - 1),
+            "packets": self.packets[slots],
+            "errors": self.errors[slots],
+            "packets_total": self.packets_total[slots],
+            "errors_total": self.errors_total[slots],
+        }
+
+
+class SeriesRing:
+    """Per-run packets/errors series with constant memory.
+
+    extend() takes per-second values (any number at a time); every resolution
+    keeps its newest `capacity` buckets. Running totals cover the whole run.
+    Safe to read from the UI thread while a worker thread extends it.
+    """
+
+    def __init__(self, capacity=RING_CAPACITY, resolutions=RESOLUTIONS):
+        self.levels = [_Level(res, capacity) for res in resolutions]
+        self.count = 0
+        self.packets_total = 0
+        self.errors_total = 0
+        self._lock = threading.Lock()
+
+    def extend(self, pps, errors):
+        pps = np.asarray(pps, dtype=np.int64)
+        errors = np.asarray(errors, dtype=np.int64)
+        if not len(pps):
+            return
+        with self._lock:
+            t = np.arange(self.count, self.count + len(pps), dtype=np.int64)
+            packets_total = self.packets_total + np.cumsum(pps)
+            errors_total = self.errors_total + np.cumsum(errors)
+            for level in self.levels:
+                level.extend(t, pps, errors, packets_total, errors_total)
+            self.count += len(pps)
+            self.packets_total = int(packets_total[-1])
+            self.errors_total = int(errors_total[-1])
+
+    def level_for(self, seconds=None):
+        """Finest resolution whose ring still holds `seconds` (default: the whole run)."""
+        seconds = self.count if seconds is None else seconds
+        for level in self.levels:
+            if -(-seconds // level.res) <= level.capacity:
+                return level
+        return self.levels[-1]
+
+    def points(self, res=None):
+        """Aggregate points at resolution res (default: level_for()) as a dict of arrays."""
+        with self._lock:
+            level = self.level_for() if res is None else next(l for l in self.levels if l.res == res)
+            return level.res, level.points(self.count)
+
+    def chart(self, budget=CHART_POINT_BUDGET):
+        """(resolution, points) for the chart, LTTB-downsampled to at most budget points."""
+        res, pts = self.points()
+        keep = lttb_indices(pts["elapsed_s"], pts["packets_total"], budget)
+        return res, {k: v[keep] for k, v in pts.items()}
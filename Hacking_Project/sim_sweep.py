@@ -0,0 +1,83 @@
+"""
+Batch parameter sweep for the Safe DoS Simulation demo.
+- SIMULATION ONLY: every run is sim_engine.simulate_series, nothing is sent.
+- The (network x duration x intensity x jitter) grid is spread over a process
+  pool; per-run seeds come from one SeedSequence so a sweep is reproducible.
+"""
+
+import itertools
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from sim_archive import columns_to_frame, entries_to_columns
+from sim_engine import build_log_entry, new_seed, series_totals, simulate_series
+
+POOL_MIN_RUNS = 64  # smaller grids run inline; pool start-up would dominate
+# same limits as the single-run controls; every worker allocates duration-sized arrays
+MAX_DURATION_S = 3600
+MAX_INTENSITY_PPS = 5000
+MAX_SWEEP_RUNS = 5000
+
+
+def parse_int_list(text):
+    """'10, 20 60' -> [10, 20, 60] (invalid items are ignored)."""
+    values = []
+    for part in text.replace(",", " ").split():
+        try:
+            values.append(int(part))
+        except ValueError:
+            continue
+    return values
+
+
+def in_bounds(durations, intensities, jitters):
+    """Keep only the values a sweep accepts (as the single-run sliders)."""
+    return ([d for d in durations if 0 < d <= MAX_DURATION_S],
+            [i for i in intensities if 0 < i <= MAX_INTENSITY_PPS],
+            [j for j in jitters if 0 <= j <= 100])
+
+
+def sweep_grid(networks, durations, intensities, jitters):
+    return list(itertools.product(networks, durations, intensities, jitters))
+
+
+def _run_one(job):
+    network, duration, intensity, jitter, seed = job
+    series = simulate_series(duration, intensity, jitter, seed)
+    return build_log_entry(network, duration, intensity, jitter, series["seed"], *series_totals(series))
+
+
+def run_sweep(networks, durations, intensities, jitters, seed=None, max_workers=None):
+    """Run every grid combination; returns log entries in grid order.
+
+    Raises ValueError for values outside in_bounds() or more than MAX_SWEEP_RUNS runs.
+    """
+    if (list(durations), list(intensities), list(jitters)) != in_bounds(durations, intensities, jitters):
+        raise ValueError(f"sweep values out of range (duration 1-{MAX_DURATION_S} s, "
+                         f"intensity 1-{MAX_INTENSITY_PPS} pps, jitter 0-100 %)")
+    grid = sweep_grid(networks, durations, intensities, jitters)
+    if len(grid) > MAX_SWEEP_RUNS:
+        raise ValueError(f"sweep grid has {len(grid)} runs (max {MAX_SWEEP_RUNS})")
+    if not grid:
+        return []
+    seeds = np.random.SeedSequence(new_seed() if seed is None else seed).generate_state(len(grid))
+    jobs = [combo + (int(s),) for combo, s in zip(grid, seeds)]
+    if len(jobs) < POOL_MIN_RUNS:
+        return [_run_one(j) for j in jobs]
+    workers = max_workers or os.cpu_count() or 1
+    chunksize = max(1, math.ceil(len(jobs) / (workers * 4)))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_run_one, jobs, chunksize=chunksize))
+
+
+def summary_frame(entries):
+    """One row per sweep run with derived rates, sorted for comparison tables."""
+    df = columns_to_frame(entries_to_columns(entries))
+    df["avg_pps"] = df["packets_sim"] / df["duration_s"].clip(lower=1)
+    df["errors_per_10k_packets"] = 1e4 * df["errors_sim"] / df["packets_sim"].clip(lower=1)
+    cols = ["ssid", "bssid", "duration_s", "intensity_pps", "jitter_percent",
+            "packets_sim", "errors_sim", "avg_pps", "errors_per_10k_packets"]
+    return df[cols].sort_values(["ssid", "bssid", "intensity_pps", "jitter_percent", "duration_s"]).reset_index(drop=True)
@@ -0,0 +1,105 @@
+"""
+Background worker for the Safe DoS Simulation demo.
+- SIMULATION ONLY: the worker just advances a clock over a generated series.
+- Each run lives in its own daemon thread, so the Streamlit script thread is
+  free for scanning/log browsing and sessions never block each other.
+- Threads never call st.*; the UI polls job attributes from a fragment.
+- The series is generated in chunks and fed into a SeriesRing, so a run
+  costs the same memory whatever its duration.
+"""
+
+import threading
+
+from sim_engine import build_log_entry, iter_series, iter_series_from_entry, new_seed
+from sim_series import SeriesRing
+
+RUNNING, FINISHED, CANCELLED = "running", "finished", "cancelled"
+
+
+class SimulationJob:
+    """One simulated run, revealed one tick (default: one second) at a time.
+
+    revealed: number of seconds fed into `ring` (and so visible) so far.
+    tick_seconds: wall-clock time per simulated second (1/speed-up factor);
+    0 means instant: the result and log record are produced right away.
+    on_done(entry) is called from the worker thread when the run completes
+    (not when cancelled), e.g. LogWriter.append_entry.
+    """
+
+    def __init__(self, counter, network, duration, intensity, jitter, tick_seconds=1.0, on_done=None, seed=None, chunks=None):
+        self.counter = counter
+        self.network = network
+        self.duration = int(duration)
+        self.intensity = intensity
+        self.jitter = jitter
+        self.tick_seconds = tick_seconds
+        self.on_done = on_done
+        self.seed = new_seed() if seed is None else seed
+        self.chunks = chunks  # (pps, errors) iterator; default: iter_series(seed)
+        self.ring = SeriesRing()
+        self.replay = False
+        self.revealed = 0
+        self.status = RUNNING
+        self.final_entry = None
+        self.error = None
+        self.reported = False  # UI has picked up the final state
+        self._cancel = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"sim-{counter}", daemon=True)
+
+    @classmethod
+    def replay_entry(cls, counter, entry, tick_seconds=1.0):
+        """Animate a saved log entry; the entry itself is the final result."""
+        params = entry.get("simulation_params") or {}
+        network = dict(entry.get("network") or {})
+        network["signal"] = network.get("signal_dbm")
+        job = cls(counter, network, params.get("duration_s") or 0,
+                  params.get("intensity_pps"), params.get("jitter_percent"),
+                  tick_seconds=tick_seconds, seed=params.get("seed"), chunks=iter_series_from_entry(entry))
+        job.replay = True
+        job.final_entry = entry
+        return job
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def cancel(self):
+        """Stop at once; the worker is woken from its wait immediately."""
+        self._cancel.set()
+
+    @property
+    def running(self):
+        return self.status == RUNNING
+
+    def _run(self):
+        try:
+            chunks = self.chunks
+            if chunks is None:
+                chunks = iter_series(self.duration, self.intensity, self.jitter, self.seed)
+            for pps, errors in chunks:
+                if self.tick_seconds <= 0:
+                    self.ring.extend(pps, errors)
+                    self.revealed = self.ring.count
+                    if self._cancel.is_set():
+                        self.status = CANCELLED
+                        return
+                    continue
+                for i in range(len(pps)):
+                    self.ring.extend(pps[i:i + 1], errors[i:i + 1])
+                    self.revealed = self.ring.count
+                    if self._cancel.wait(self.tick_seconds):
+                        self.status = CANCELLED
+                        return
+            if self.replay:
+                self.status = FINISHED
+                return
+            self.final_entry = build_log_entry(
+                self.network, self.duration, self.intensity, self.jitter,
+                self.seed, self.ring.packets_total, self.ring.errors_total
+            )
+            if self.on_done is not None:
+                self.on_done(self.final_entry)
+            self.status = FINISHED
+        except Exception as e:
+            self.error = e
+            self.status = CANCELLED
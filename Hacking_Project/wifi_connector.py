@@ -1,47 +1,34 @@
 # app.py
-import time
+import hashlib
+import threading
 import streamlit as st
-from pywifi import PyWiFi, const, Profile
+from pywifi import const, Profile
+import perf_timing
+from app_helpers import poll_every
+from perf_timing import timed
+from wifi_scan import get_pywifi_interface, get_scanner, strongest_by_ssid
+from wifi_watch import CONNECTED, ConnectionWatcher
 
 st.set_page_config(page_title="Wi-Fi Connector (pywifi + Streamlit)", layout="centered")
+perf_timing.begin_rerun("connector")
 
 # --- Helpers ---
 def get_interface():
-    wifi = PyWiFi()
-    ifaces = wifi.interfaces()
-    if not ifaces:
-        return None
-    return ifaces[0]   # default: first wireless interface
+    """First wireless interface, shared by every session and rerun (same handle the scanner uses).
 
+    Not st.cache_resource: a missing adapter (None) is looked up again on the next rerun.
+    """
+    return get_pywifi_interface()
+
+@timed("scan.networks")
 def scan_networks(iface, scan_wait=2):
-    """Trigger scan and return list of networks (unique SSIDs)."""
+    """Return list of networks (unique SSIDs, strongest first) from the shared scanner."""
     try:
-        iface.scan()
+        networks = get_scanner("pywifi", timeout=scan_wait).get()
     except Exception as e:
         st.error(f"Scan failed: {e}")
         return []
-    time.sleep(scan_wait)  # allow some time for scan to complete
-    try:
-        results = iface.scan_results()
-    except Exception as e:
-        st.error(f"Failed to get scan results: {e}")
-        return []
-
-    # gather unique SSIDs (keep strongest signal if duplicates)
-    seen = {}
-    for r in results:
-        ssid = r.ssid or "<hidden>"
-        # signal attribute may be named 'signal' or 'rssi' depending on platform/pywifi; handle gracefully
-        sig = getattr(r, "signal", None)
-        if sig is None:
-            sig = getattr(r, "rssi", None)
-        # keep strongest
-        if ssid not in seen or (sig is not None and (seen[ssid]["signal"] is None or sig > seen[ssid]["signal"])):
-            seen[ssid] = {"ssid": ssid, "bssid": getattr(r, "bssid", None), "signal": sig, "akm": getattr(r, "akm", None)}
-    # return sorted by signal desc if available
-    networks = list(seen.values())
-    networks.sort(key=lambda x: (x["signal"] is None, -(x["signal"] or 0)))
-    return networks
+    return strongest_by_ssid(networks)
 
 def build_profile(ssid, password, hidden=False):
     p = Profile()
@@ -58,35 +45,105 @@ def build_profile(ssid, password, hidden=False):
     p.key = password
     return p
 
+class ProfileCache:
+    """Profiles this process added, keyed by (SSID, auth, AKM).
+
+    A repeat connect reuses the stored profile; it is only rebuilt (and just
+    that SSID's OS profile replaced) when the password or hidden flag change.
+    Credentials are compared by hash, but the stored pywifi Profile (needed to
+    reconnect) holds the key in plain text, like the OS profile itself; the
+    cache lives in server memory only and is never shown or logged.
+    """
+
+    def __init__(self):
+        self._profiles = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(profile):
+        return (profile.ssid, profile.auth, tuple(profile.akm))
+
+    @staticmethod
+    def secret(profile):
+        return hashlib.sha256(f"{profile.hidden}:{profile.key}".encode("utf-8")).hexdigest()
+
+    def profile_for(self, iface, ssid, password, hidden=False):
+        """Return (profile to connect with, reused?)."""
+        wanted = build_profile(ssid, password, hidden)
+        key, secret = self.key(wanted), self.secret(wanted)
+        with self._lock:
+            cached = self._profiles.get(key)
+            if cached is not None and cached[1] == secret:
+                return cached[0], True
+            # new or changed credentials: replace this SSID's profile only
+            try:
+                for old in iface.network_profiles():
+                    if old.ssid == ssid:
+                        iface.remove_network_profile(old)
+            except Exception:
+                pass
+            tmp = iface.add_network_profile(wanted)
+            self._profiles[key] = (tmp, secret)
+            return tmp, False
+
+    def forget(self, ssid):
+        """Drop cached profiles for ssid (e.g. after a failed connect)."""
+        with self._lock:
+            for key in [k for k in self._profiles if k[0] == ssid]:
+                del self._profiles[key]
+
+@st.cache_resource
+def get_profile_cache():
+    return ProfileCache()
+
+@timed("connect.start")
 def connect_to_network(iface, ssid, password, timeout=20, hidden=False):
-    # Remove existing profiles optionally (safer to not remove all in some environments)
-    try:
-        iface.remove_all_network_profiles()
-    except Exception:
-        pass
+    """Start connecting in the background; returns the ConnectionWatcher to poll."""
+    profiles = get_profile_cache()
+    tmp, reused = profiles.profile_for(iface, ssid, password, hidden)
 
-    profile = build_profile(ssid, password, hidden)
-    tmp = iface.add_network_profile(profile)
+    def on_done(ok):
+        if not ok:
+            profiles.forget(ssid)  # maybe a wrong password: rebuild next time
 
-    try:
-        iface.connect(tmp)
-    except Exception as e:
-        return False, f"Connect failed: {e}"
-
-    start = time.time()
-    while time.time() - start < timeout:
-        st.session_state["last_status_poll"] = time.time()
-        state = iface.status()
-        # const.IFACE_CONNECTED typically equals 4
-        if state == const.IFACE_CONNECTED:
-            return True, "Connected"
-        time.sleep(1)
-    # timeout
-    try:
-        iface.disconnect()
-    except Exception:
-        pass
-    return False, "Connection timed out or wrong password"
+    watcher = ConnectionWatcher(iface, ssid, tmp, timeout=timeout, on_done=on_done)
+    watcher.reused_profile = reused
+    return watcher.start()
+
+def cancel_connect(wait=False):
+    """Stop this session's connect attempt; wait=True also lets it finish
+    (disconnect, forget the profile) so it cannot undo a newer attempt."""
+    watcher = st.session_state.get("connect_job")
+    if watcher is not None:
+        watcher.cancel()
+        if wait:
+            watcher.wait()
+
+@poll_every(0.5)
+def connect_progress():
+    """Live view of the connection watcher; publishes its state to the session.
+
+    Once the outcome is reported connect_job is cleared, which ends the polling.
+    """
+    watcher = st.session_state.get("connect_job")
+    if watcher is None:
+        return
+    st.session_state["connect_state"] = watcher.state
+    st.session_state["connect_transitions"] = list(watcher.transitions)
+    if watcher.transitions:
+        st.caption(" → ".join(f"{name} ({t:.2f}s)" for t, name in watcher.transitions))
+    if watcher.running:
+        st.progress(min(1.0, watcher.elapsed() / max(1, watcher.timeout)),
+                    text=f"Connecting to {watcher.ssid} ... {watcher.state or 'starting'} ({watcher.elapsed():.1f}s)")
+        st.button("Cancel", on_click=cancel_connect, key="cancel_connect")
+        return
+    watcher.reported = True
+    msg = watcher.message
+    if watcher.status == CONNECTED and watcher.reused_profile:
+        msg = "Connected (saved profile reused)"
+    st.session_state["connect_result"] = (watcher.status == CONNECTED, msg)
+    st.session_state["connect_job"] = None
+    st.rerun()
 
 # --- Streamlit UI ---
 st.title("📶 Wi-Fi Connector (pywifi + Streamlit)")
@@ -97,10 +154,13 @@ if "selected_ssid" not in st.session_state:
     st.session_state["selected_ssid"] = None
 if "connect_result" not in st.session_state:
     st.session_state["connect_result"] = None
+if "connect_job" not in st.session_state:
+    st.session_state["connect_job"] = None
 
 iface = get_interface()
 if iface is None:
     st.error("No wireless interface found. Ensure your Wi-Fi adapter is enabled and drivers are installed.")
+    perf_timing.sidebar_panel()
     st.stop()
 else:
     st.info(f"Using interface: {iface.name()}")
@@ -139,10 +199,13 @@ with col2:
             if submitted:
                 ssid = st.session_state["selected_ssid"]
                 st.session_state["connect_result"] = None
-                with st.spinner(f"Trying to connect to {ssid} ..."):
-                    ok, msg = connect_to_network(iface, ssid, pwd, timeout=timeout, hidden=hidden_chk)
-                    st.session_state["connect_result"] = (ok, msg)
-    if st.session_state["connect_result"]:
+                cancel_connect(wait=True)
+                st.session_state["connect_job"] = connect_to_network(iface, ssid, pwd, timeout=timeout, hidden=hidden_chk)
+    if st.session_state["connect_job"] is not None:
+        connect_progress()
+    elif st.session_state["connect_result"]:
+        if st.session_state.get("connect_transitions"):
+            st.caption(" → ".join(f"{name} ({t:.2f}s)" for t, name in st.session_state["connect_transitions"]))
         ok, msg = st.session_state["connect_result"]
         if ok:
             st.success(f"{msg}")
@@ -151,3 +214,5 @@ with col2:
 
 st.markdown("---")
 st.caption("Note: Run Streamlit with admin/root if connection/scan fails. macOS support for pywifi may be limited.")
+
+perf_timing.sidebar_panel()
@@ -0,0 +1,314 @@
+"""
+Shared Wi-Fi scanning service for the three Streamlit apps.
+- Pluggable backends: pywifi, Windows `netsh wlan show network mode=Bssid`
+  text parser, recorded fixture (JSON or netsh capture) and a mock for CI.
+- One scan cache per backend per process (all sessions share it), with TTL
+  and an optional background refresher. Concurrent callers that find the
+  snapshot stale are coalesced onto a single scan.
+- Results are normalised dicts {ssid, bssid, signal, freq, ...}, deduped by
+  (SSID, BSSID) keeping the strongest signal, in one pass.
+- A pywifi scan stops waiting as soon as the result list stops changing.
+
+Backend choice: WIFI_SCAN_BACKEND=pywifi|netsh|fixture|mock (default: pywifi
+if importable, netsh on Windows, otherwise mock); WIFI_SCAN_FIXTURE=<path>.
+"""
+
+import json
+import os
+import platform
+import random
+import subprocess
+import threading
+import time
+
+from perf_timing import timed
+
+try:
+    import pywifi
+    PYWIFI_AVAILABLE = True
+except Exception:
+    PYWIFI_AVAILABLE = False
+
+DEFAULT_TTL = 30          # seconds a snapshot counts as fresh
+STABLE_POLL = 0.25        # seconds between scan_results() polls
+STABLE_POLLS = 3          # identical polls in a row = scan settled
+MIN_SCAN_WAIT = 0.5       # drivers often return the previous list right after scan()
+NETSH_CMD = ["netsh", "wlan", "show", "network", "mode=Bssid"]
+
+_iface_lock = threading.Lock()
+_iface = None
+
+
+# ---- Normalising / dedupe ----
+def channel_to_freq(channel):
+    """Wi-Fi channel number -> centre frequency in MHz (None if unknown)."""
+    if channel is None:
+        return None
+    if channel == 14:
+        return 2484
+    if 1 <= channel <= 13:
+        return 2407 + 5 * channel
+    if 32 <= channel <= 177:
+        return 5000 + 5 * channel
+    return None
+
+
+def percent_to_dbm(percent):
+    """Windows signal quality (0-100 %) -> approximate dBm."""
+    return int(percent) // 2 - 100
+
+
+def dedupe_strongest(networks, key=("ssid", "bssid")):
+    """One pass over network dicts, keeping the strongest signal per key.
+
+    Missing signals lose against any known signal. Order of first sight is kept.
+    """
+    best = {}
+    for n in networks:
+        k = tuple(n.get(f) for f in key)
+        cur = best.get(k)
+        if cur is None or (n.get("signal") is not None and (cur.get("signal") is None or n["signal"] > cur["signal"])):
+            best[k] = n
+    return list(best.values())
+
+
+def strongest_by_ssid(networks):
+    """Unique SSIDs (hidden ones as '<hidden>'), strongest first."""
+    named = ({**n, "ssid": n.get("ssid") or "<hidden>"} for n in networks)
+    unique = dedupe_strongest(named, key=("ssid",))
+    unique.sort(key=lambda x: (x["signal"] is None, -(x["signal"] or 0)))
+    return unique
+
+
+# ---- Backends: each is scan(timeout) -> list of deduped network dicts ----
+def get_pywifi_interface():
+    """First wireless interface, created once per process (None if there is none)."""
+    global _iface
+    with _iface_lock:
+        if _iface is None and PYWIFI_AVAILABLE:
+            ifaces = pywifi.PyWiFi().interfaces()
+            _iface = ifaces[0] if ifaces else None
+        return _iface
+
+
+@timed("scan.pywifi_wait")
+def wait_for_stable_results(iface, timeout=3):
+    """Poll scan_results() until it stops changing (or timeout); return the results."""
+    deadline = time.time() + timeout
+    time.sleep(min(MIN_SCAN_WAIT, timeout))
+    results = iface.scan_results()
+    last_key, same = None, 0
+    while time.time() < deadline:
+        key = frozenset((r.ssid, r.bssid) for r in results)
+        if key and key == last_key:
+            same += 1
+            if same >= STABLE_POLLS:
+                break
+        else:
+            last_key, same = key, 0
+        time.sleep(STABLE_POLL)
+        results = iface.scan_results()
+    return results
+
+
+def _pywifi_network(r):
+    # signal attribute may be named 'signal' or 'rssi' depending on platform/pywifi
+    sig = getattr(r, "signal", None)
+    if sig is None:
+        sig = getattr(r, "rssi", None)
+    return {
+        'ssid': r.ssid,
+        'bssid': getattr(r, 'bssid', None),
+        'signal': sig,
+        'freq': getattr(r, 'freq', None),
+        'akm': getattr(r, 'akm', None)
+    }
+
+
+def scan_pywifi(timeout=3):
+    """Scan using the shared pywifi interface. Returns list of dicts {ssid,bssid,signal,freq,akm}"""
+    iface = get_pywifi_interface()
+    if iface is None:
+        return []
+    iface.scan()
+    return dedupe_strongest(_pywifi_network(r) for r in wait_for_stable_results(iface, timeout))
+
+
+def parse_netsh_networks(text):
+    """Parse `netsh wlan show network mode=Bssid` output into one dict per BSSID."""
+    networks = []
+    ssid, auth, cur = None, None, None
+    for line in text.splitlines():
+        line = line.strip()
+        if ":" not in line:
+            continue
+        label, value = (part.strip() for part in line.split(":", 1))
+        if label.startswith("SSID "):
+            ssid, auth, cur = value, None, None
+        elif label == "Authentication":
+            auth = value
+        elif label.startswith("BSSID "):
+            cur = {'ssid': ssid, 'bssid': value, 'signal': None, 'signal_percent': None,
+                   'freq': None, 'channel': None, 'auth': auth}
+            networks.append(cur)
+        elif cur is None:
+            continue
+        elif label == "Signal":
+            try:
+                cur['signal_percent'] = int(value.rstrip("%"))
+                cur['signal'] = percent_to_dbm(cur['signal_percent'])
+            except ValueError:
+                pass
+        elif label == "Channel":
+            try:
+                cur['channel'] = int(value)
+                cur['freq'] = channel_to_freq(cur['channel'])
+            except ValueError:
+                pass
+    return dedupe_strongest(networks)
+
+
+def scan_netsh(timeout=10):
+    """Windows only: run netsh and parse it (netsh reports the OS's last scan)."""
+    with timed("scan.netsh_subprocess"):
+        out = subprocess.check_output(NETSH_CMD, stderr=subprocess.STDOUT, timeout=max(timeout, 5))
+    with timed("scan.netsh_parse"):
+        return parse_netsh_networks(out.decode("utf-8", errors="backslashreplace"))
+
+
+def scan_fixture(timeout=0, path=None):
+    """Recorded scan: a JSON list of network dicts or a saved netsh text capture."""
+    path = path or os.environ.get("WIFI_SCAN_FIXTURE")
+    if not path:
+        return mock_scan_networks()
+    with open(path, encoding="utf-8", errors="backslashreplace") as f:
+        text = f.read()
+    if path.endswith(".json"):
+        return dedupe_strongest(json.loads(text))
+    return parse_netsh_networks(text)
+
+
+def mock_scan_networks(timeout=0):
+    """Return a mocked list of networks for demo purposes."""
+    sample_ssids = [
+        "Cafe_Free_WiFi", "Home-Net_2.4G", "OfficeNet", "HiddenSSID", "Campus-Guest", "IoT-AP-123"
+    ]
+    nets = []
+    for i, s in enumerate(sample_ssids):
+        nets.append({
+            'ssid': s,
+            'bssid': f"02:00:00:00:0{i:02x}",
+            'signal': random.randint(-90, -30),
+            'freq': random.choice([2412, 2437, 2462, 5180])
+        })
+    return nets
+
+
+BACKENDS = {
+    "pywifi": scan_pywifi,
+    "netsh": scan_netsh,
+    "fixture": scan_fixture,
+    "mock": mock_scan_networks,
+}
+
+
+def default_backend():
+    name = os.environ.get("WIFI_SCAN_BACKEND")
+    if name in BACKENDS:
+        return name
+    if PYWIFI_AVAILABLE:
+        return "pywifi"
+    if platform.system() == "Windows":
+        return "netsh"
+    return "mock"
+
+
+# ---- Cache ----
+class ScanCache:
+    """Process-wide scan snapshot with TTL and a background refresher.
+
+    get() returns the latest snapshot immediately; it only scans in the
+    caller's thread when there is no snapshot yet or it is older than ttl.
+    scan_fn(timeout) does the actual scan; ttl/timeout may be changed live.
+    """
+
+    def __init__(self, scan_fn, ttl=DEFAULT_TTL, timeout=3):
+        self.scan_fn = scan_fn
+        self.ttl = ttl
+        self.timeout = timeout
+        self.networks = None
+        self.updated_at = 0.0
+        self.error = None
+        self._scan_lock = threading.Lock()
+        self._thread = None
+
+    def age(self):
+        return time.time() - self.updated_at if self.networks is not None else None
+
+    def refresh(self, max_age=None):
+        """Run one scan now (scans never overlap) and store the snapshot.
+
+        With max_age, a snapshot that became fresh while waiting for the lock
+        (another thread just scanned) is returned instead of scanning again.
+        """
+        with self._scan_lock:
+            age = self.age()
+            if max_age is not None and age is not None and age <= max_age:
+                return self.networks
+            try:
+                with timed("scan.refresh"):
+                    networks = self.scan_fn(self.timeout)
+            except Exception as e:
+                self.error = e
+                raise
+            self.networks = networks
+            self.updated_at = time.time()
+            self.error = None
+            return networks
+
+    def get(self, max_age=None):
+        """Latest snapshot; scans (coalesced) if it is older than max_age/ttl."""
+        max_age = self.ttl if max_age is None else max_age
+        age = self.age()
+        if age is None or age > max_age:
+            return self.refresh(max_age=max_age)
+        return self.networks
+
+    def start(self):
+        """Start the daemon refresher (idempotent); refreshes every ttl/2."""
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._refresh_loop, name="wifi-scan-cache", daemon=True)
+            self._thread.start()
+        return self
+
+    def _refresh_loop(self):
+        while True:
+            try:
+                self.refresh()
+            except Exception:
+                pass  # kept in self.error; try again next round
+            time.sleep(max(1.0, self.ttl / 2))
+
+
+_scanners_lock = threading.Lock()
+_scanners = {}
+
+
+def get_scanner(backend=None, ttl=None, timeout=None, background=False):
+    """The process-wide ScanCache for a backend (created on first use).
+
+    ttl/timeout, when given, update the shared cache; background=True starts
+    its refresher thread.
+    """
+    name = backend or default_backend()
+    with _scanners_lock:
+        cache = _scanners.get(name)
+        if cache is None:
+            cache = _scanners[name] = ScanCache(BACKENDS[name])
+    if ttl is not None:
+        cache.ttl = ttl
+    if timeout is not None:
+        cache.timeout = timeout
+    if background:
+        cache.start()
+    return cache
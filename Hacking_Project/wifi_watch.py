@@ -0,0 +1,156 @@
+"""
+Background connection watcher for the Wi-Fi Connector.
+- iface.connect() returns at once; the watcher thread then polls
+  iface.status() quickly at first and backs off, restarting fast after every
+  state change, so a connect is noticed within ~50 ms instead of up to 1 s.
+- Each state change (scanning, associating, connected, disconnected) is kept
+  in `transitions` for the UI.
+- An interface still associated (e.g. with the previous network) is
+  disconnected first, so its CONNECTED state is not taken for the new one.
+- Threads never call st.*; the UI polls watcher attributes from a fragment.
+"""
+
+import threading
+import time
+
+try:
+    from pywifi import const
+    STATE_NAMES = {
+        const.IFACE_DISCONNECTED: "disconnected",
+        const.IFACE_SCANNING: "scanning",
+        const.IFACE_INACTIVE: "inactive",
+        const.IFACE_CONNECTING: "associating",
+        const.IFACE_CONNECTED: "connected",
+    }
+    IFACE_CONNECTED = const.IFACE_CONNECTED
+except Exception:
+    STATE_NAMES = {0: "disconnected", 1: "scanning", 2: "inactive", 3: "associating", 4: "connected"}
+    IFACE_CONNECTED = 4
+
+POLL_START = 0.05      # seconds between status() polls right after a change
+POLL_MAX = 1.0
+POLL_BACKOFF = 1.5
+
+CONNECTING, CONNECTED, FAILED, CANCELLED = "connecting", "connected", "failed", "cancelled"
+
+
+class ConnectionWatcher:
+    """Connect with one profile and follow the interface until connected or timeout.
+
+    on_done(ok) is called from the worker thread once the outcome is known.
+    """
+
+    def __init__(self, iface, ssid, profile, timeout=20, on_done=None):
+        self.iface = iface
+        self.ssid = ssid
+        self.profile = profile
+        self.timeout = timeout
+        self.on_done = on_done
+        self.status = CONNECTING
+        self.state = None             # latest interface state name
+        self.transitions = []         # [(elapsed_s, state name)]
+        self.message = None
+        self.polls = 0
+        self.started_at = None
+        self.reported = False         # UI has picked up the final state
+        self._cancel = threading.Event()
+        self._done = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"wifi-connect-{ssid}", daemon=True)
+
+    def start(self):
+        self.started_at = time.time()
+        self._thread.start()
+        return self
+
+    def cancel(self):
+        self._cancel.set()
+
+    def wait(self, timeout=None):
+        """Block until the outcome is known; returns True when connected."""
+        self._done.wait(timeout)
+        return self.status == CONNECTED
+
+    @property
+    def running(self):
+        return self.status == CONNECTING
+
+    def elapsed(self):
+        return time.time() - self.started_at if self.started_at else 0.0
+
+    def _observe(self, code):
+        name = STATE_NAMES.get(code, str(code))
+        changed = name != self.state
+        if changed:
+            self.state = name
+            self.transitions.append((round(self.elapsed(), 2), name))
+        return changed
+
+    def _finish(self, status, message):
+        self.status, self.message = status, message
+        if status != CONNECTED:
+            try:
+                self.iface.disconnect()
+            except Exception:
+                pass
+        if self.on_done is not None:
+            try:
+                self.on_done(status == CONNECTED)
+            except Exception:
+                pass
+        self._done.set()
+
+    def _release(self, deadline):
+        """Disconnect a still-associated interface and wait until it leaves
+        IFACE_CONNECTED; False on timeout or cancel."""
+        code = self.iface.status()
+        if code != IFACE_CONNECTED:
+            return True
+        self._observe(code)
+        self.iface.disconnect()
+        interval = POLL_START
+        while True:
+            self.polls += 1
+            code = self.iface.status()
+            if code != IFACE_CONNECTED:
+                self._observe(code)
+                return True
+            remaining = deadline - time.time()
+            if remaining <= 0 or self._cancel.wait(min(interval, remaining)):
+                return False
+            interval = min(POLL_MAX, interval * POLL_BACKOFF)
+
+    def _run(self):
+        deadline = self.started_at + self.timeout
+        try:
+            released = self._release(deadline)
+            if released:
+                self.iface.connect(self.profile)
+        except Exception as e:
+            self._finish(FAILED, f"Connect failed: {e}")
+            return
+        if not released:
+            if self._cancel.is_set():
+                self._finish(CANCELLED, "Connection attempt cancelled")
+            else:
+                self._finish(FAILED, "Could not leave the current network")
+            return
+        interval = POLL_START
+        while True:
+            self.polls += 1
+            try:
+                code = self.iface.status()
+            except Exception as e:
+                self._finish(FAILED, f"Status check failed: {e}")
+                return
+            if code == IFACE_CONNECTED:
+                self._observe(code)
+                self._finish(CONNECTED, "Connected")
+                return
+            interval = POLL_START if self._observe(code) else min(POLL_MAX, interval * POLL_BACKOFF)
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                self._finish(FAILED, "Connection timed out or wrong password")
+                return
+            if self._cancel.wait(min(interval, remaining)):
+                self._finish(CANCELLED, "Connection attempt cancelled")
+                return